@@ -14,6 +14,8 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any
 
+from ..common.serialization import loads_json
+
 
 def parse_cache_session(cache_file: Path) -> Dict[str, Any]:
     """
@@ -26,12 +28,12 @@ def parse_cache_session(cache_file: Path) -> Dict[str, Any]:
         Session envelope dict with extracted metadata
     """
     # Check if file is Gemini JSON format (single object vs JSONL)
-    with open(cache_file, 'r') as f:
+    with open(cache_file, 'rb') as f:
         content = f.read()
 
     # Try to parse as single JSON object (Gemini format)
     try:
-        data = json.loads(content)
+        data = loads_json(content)
         if "sessionId" in data and "messages" in data and "projectHash" in data:
             # Gemini format detected
             return _parse_gemini_session(data, cache_file)
@@ -48,11 +50,11 @@ def parse_cache_session(cache_file: Path) -> Dict[str, Any]:
     timestamps = []
     source_type = None  # Auto-detect: "claude-code-cache" or "codex-cache"
 
-    for line in content.split('\n'):
+    for line in content.split(b'\n'):
         if not line.strip():
             continue
 
-        entry = json.loads(line)
+        entry = loads_json(line)
         entry_type = entry.get("type")
 
         # Codex format: session_meta contains metadata
@@ -9,7 +9,9 @@ import json
 import yaml
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Set
+
+from ..common.serialization import YAML_LOADER
 
 
 def load_ingestion_history(history_file: Path) -> Dict[str, List[Dict]]:
@@ -29,7 +31,7 @@ def load_ingestion_history(history_file: Path) -> Dict[str, List[Dict]]:
         content = f.read().strip()
         if not content:
             return {"processed_sessions": []}
-        return yaml.safe_load(content) or {"processed_sessions": []}
+        return yaml.load(content, Loader=YAML_LOADER) or {"processed_sessions": []}
 
 
 def save_ingestion_history(history: Dict[str, List[Dict]], history_file: Path) -> None:
@@ -46,17 +48,35 @@ def save_ingestion_history(history: Dict[str, List[Dict]], history_file: Path) -
         yaml.dump(history, f, default_flow_style=False, sort_keys=False)
 
 
-def is_session_processed(history: Dict[str, List[Dict]], session_id: str) -> bool:
+def index_processed_sessions(history: Dict[str, List[Dict]]) -> Set[str]:
+    """
+    Build the set of processed session IDs for O(1) lookups.
+
+    Pass it to is_session_processed / mark_session_processed, which keep it
+    in sync, when checking many sessions against the same history.
+    """
+    return {entry.get("session_id") for entry in history.get("processed_sessions", [])}
+
+
+def is_session_processed(
+    history: Dict[str, List[Dict]],
+    session_id: str,
+    processed_ids: Optional[Set[str]] = None
+) -> bool:
     """
     Check if session_id already exists in history.
 
     Args:
         history: Ingestion history dict
         session_id: Session ID to check
+        processed_ids: Optional index from index_processed_sessions(history)
 
     Returns:
         True if session already processed, False otherwise
     """
+    if processed_ids is not None:
+        return session_id in processed_ids
+
     for entry in history.get("processed_sessions", []):
         if entry.get("session_id") == session_id:
             return True
@@ -69,7 +89,8 @@ def mark_session_processed(
     source: str,
     source_path: str,
     timestamp: str = None,
-    project_path: str = None
+    project_path: str = None,
+    processed_ids: Optional[Set[str]] = None
 ) -> None:
     """
     Add session to processed history (prevents duplicates).
@@ -81,9 +102,10 @@ def mark_session_processed(
         source_path: Path to source file
         timestamp: Optional ISO 8601 timestamp for fallback matching
         project_path: Optional project path for fallback matching
+        processed_ids: Optional index from index_processed_sessions(history), kept in sync
     """
     # Check if session already exists
-    if is_session_processed(history, session_id):
+    if is_session_processed(history, session_id, processed_ids):
         return  # Skip - already processed
 
     entry = {
@@ -100,6 +122,8 @@ def mark_session_processed(
         entry["project_path"] = project_path
 
     history.setdefault("processed_sessions", []).append(entry)
+    if processed_ids is not None:
+        processed_ids.add(session_id)
 
 
 def extract_session_id_from_cache(cache_file: Path) -> str:
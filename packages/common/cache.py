@@ -0,0 +1,73 @@
+"""
+On-disk cache for values derived from ledger and transcript files.
+
+Entries live under $XDG_CACHE_HOME/operator-ledger, one JSON file per
+source path and prefix. Some entries carry prompt text, so the cache is
+owner-only like ~/.claude itself: the directory is kept at 0700 (tightened
+if another tool created it more loosely) and files are created 0600.
+
+Every operation is best effort; an unwritable cache never fails a script.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from .serialization import loads_json
+
+# Derived indexes are cached here, never in the ledger itself
+CACHE_DIR = Path(os.getenv('XDG_CACHE_HOME', '~/.cache')).expanduser() / 'operator-ledger'
+
+
+def cache_path(prefix: str, source_path: Path) -> Path:
+    """Cache file for a value derived from source_path (one per source path)."""
+    path_key = hashlib.blake2b(str(Path(source_path).resolve()).encode(), digest_size=16).hexdigest()
+    return CACHE_DIR / f"{prefix}_{path_key}.json"
+
+
+def stat_key(path: Path) -> Optional[List[int]]:
+    """[size, mtime_ns] identifying a source file's contents, or None if it cannot be read."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def read_cache(path: Path) -> Optional[Dict]:
+    """Load a cache file; a missing or corrupt cache reads as None."""
+    try:
+        with open(path, 'rb') as f:
+            cached = loads_json(f.read())
+    except (OSError, ValueError):
+        return None
+    return cached if isinstance(cached, dict) else None
+
+
+def write_cache(path: Path, payload: Dict) -> None:
+    """Atomically write an owner-only cache file."""
+    try:
+        CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # mkdir leaves an existing directory's mode alone
+        if CACHE_DIR.stat().st_mode & 0o077:
+            CACHE_DIR.chmod(0o700)
+        tmp_file = path.with_suffix(f".{os.getpid()}.tmp")
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with open(fd, 'w') as f:
+            json.dump(payload, f)
+        os.replace(tmp_file, path)
+    except OSError:
+        pass
+
+
+def prune_cache(prefix: str, source_paths: Iterable[Path]) -> None:
+    """Delete prefix cache entries whose source is not in source_paths."""
+    keep = {cache_path(prefix, path).name for path in source_paths}
+    try:
+        for path in CACHE_DIR.glob(f"{prefix}_*.json"):
+            if path.name not in keep:
+                path.unlink()
+    except OSError:
+        pass
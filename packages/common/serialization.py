@@ -0,0 +1,29 @@
+"""
+Serialization helpers shared by capture modules and ledger scripts.
+
+YAML goes through LibYAML when PyYAML was built with it, and JSON through
+orjson when it is installed; both fall back to the pure-Python parsers.
+"""
+
+import json
+
+import yaml
+
+try:
+    import orjson  # Optional: faster JSON/JSONL parsing
+except ImportError:
+    orjson = None
+
+# LibYAML-backed loader/dumper when PyYAML was built with it
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+
+def loads_json(raw: bytes):
+    """Decode a JSON document or JSONL record, with orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # stdlib json also accepts NaN/Infinity and >64-bit integers
+    return json.loads(raw)
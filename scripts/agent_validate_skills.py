@@ -149,6 +149,17 @@ OUTCOME_PATTERNS = {
 }
 
 
+# Compiled once at import, in table order
+_OUTCOME_REGEXES = {
+    outcome_type: [re.compile(pattern, re.IGNORECASE) for pattern in config["patterns"]]
+    for outcome_type, config in OUTCOME_PATTERNS.items()
+}
+_TEST_METRIC_RE = re.compile(
+    r'(\d+(?:\.\d+)?%?)\s+(?:passing|passed|tests?|accuracy|success|completion|coverage)',
+    re.IGNORECASE
+)
+
+
 def extract_outcome_evidence_from_transcripts(
     skill_name: str,
     transcripts: List[Dict]
@@ -173,19 +184,15 @@ def extract_outcome_evidence_from_transcripts(
                 date = ""
 
             # Check each outcome type
-            for outcome_type, config in OUTCOME_PATTERNS.items():
-                for pattern in config["patterns"]:
-                    matches = re.finditer(pattern, content, re.IGNORECASE)
+            for outcome_type, patterns in _OUTCOME_REGEXES.items():
+                for pattern in patterns:
+                    matches = pattern.finditer(content)
                     for match in matches:
                         matched_text = match.group(0)
 
                         # Extract reference based on type
                         if outcome_type == "tests_passed":
-                            metric_match = re.search(
-                                r'(\d+(?:\.\d+)?%?)\s+(?:passing|passed|tests?|accuracy|success|completion|coverage)',
-                                matched_text,
-                                re.IGNORECASE
-                            )
+                            metric_match = _TEST_METRIC_RE.search(matched_text)
                             reference = f"metric:{metric_match.group(1)}" if metric_match else f"metric:{matched_text}"
                         elif outcome_type == "code_shipped":
                             reference = f"detected:{matched_text[:50]}"
@@ -19,6 +19,7 @@ from packages.capture.cache_parser import parse_cache_session
 from packages.capture.deduplication import (
     load_ingestion_history,
     save_ingestion_history,
+    index_processed_sessions,
     is_session_processed,
     mark_session_processed,
     extract_session_id_from_cache
@@ -83,6 +84,7 @@ def incremental_ingest(cache_dir: Path, history_file: Path, since_minutes: int =
 
     # Load history
     history = load_ingestion_history(history_file)
+    processed_ids = index_processed_sessions(history)
 
     # Statistics
     processed = 0
@@ -101,7 +103,7 @@ def incremental_ingest(cache_dir: Path, history_file: Path, since_minutes: int =
                 continue
 
             # Check if already processed
-            if is_session_processed(history, session_id):
+            if is_session_processed(history, session_id, processed_ids):
                 duplicates += 1
                 continue
 
@@ -116,7 +118,8 @@ def incremental_ingest(cache_dir: Path, history_file: Path, since_minutes: int =
                 parsed.get('source', 'claude-code-cache'),
                 str(cache_file),
                 timestamp=parsed.get('start_time'),
-                project_path=parsed.get('project_path')
+                project_path=parsed.get('project_path'),
+                processed_ids=processed_ids
             )
 
             processed += 1
@@ -9,7 +9,7 @@ Drill down from ledger skills to specific session evidence. Answers questions li
 
 Examples:
     python query_sessions.py --skill "Project Management"
-    python query_sessions.py --skill "Python Development" --with-ref
+    python query_sessions.py --skill "Python Development" --with-ref --pretty
     python query_sessions.py --confidence-below 50 --with-ref --format table
     python query_sessions.py --last-n-days 7 --skill "Verification"
     python query_sessions.py --project "Voice Pipeline" --format table
@@ -19,17 +19,40 @@ in the YAML ledger files, making it easy to jump to the source.
 """
 
 import argparse
+import functools
+import hashlib
 import json
 import os
+import pickle
 import re
-import yaml
+import sys
+from itertools import islice, repeat
+from operator import itemgetter
 from pathlib import Path
-from datetime import datetime, timedelta
-from typing import Dict, List, Tuple, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterator, List, NamedTuple, Set, Tuple, Optional
 
+# Add project root to path for packages/ imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from packages.common.cache import cache_path, read_cache, stat_key, write_cache
+from packages.common.parallel import pool_workers, process_pool
 
-def load_skills(ledger_path: Path, active_only: bool = False) -> Tuple[Dict, Path]:
-    """Load skills.yaml from ledger. Returns (skills_data, skills_file_path)."""
+# Below this size a process pool costs more than it saves on the line-reference scan
+PARALLEL_SCAN_MIN_BYTES = 1 << 20
+
+_SKILLS_SECTION_RE = re.compile(rb'^skills:[ \t]*(?:#.*)?$', re.MULTILINE)
+_TOP_LEVEL_LINE_RE = re.compile(rb'^[^\s#]', re.MULTILINE)
+
+
+def _yaml_loader():
+    """Import PyYAML on first use; the shared loader prefers LibYAML."""
+    # Deferred so --help and argument errors skip the PyYAML import
+    from packages.common.serialization import YAML_LOADER
+    return YAML_LOADER
+
+
+def find_skills_file(ledger_path: Path, active_only: bool = False) -> Path:
+    """Resolve the skills YAML to query inside the ledger."""
     # Prefer skills_active.yaml if it exists, fallback to skills.yaml
     if active_only:
         skills_file = ledger_path / "packages" / "ledger" / "skills_active.yaml"
@@ -41,12 +64,39 @@ def load_skills(ledger_path: Path, active_only: bool = False) -> Tuple[Dict, Pat
     if not skills_file.exists():
         raise FileNotFoundError(f"Skills file not found: {skills_file}")
 
-    with open(skills_file, 'r') as f:
-        return yaml.safe_load(f), skills_file
+    return skills_file
 
 
-def load_transcripts_index(transcripts_path: Path) -> Dict:
-    """Load transcripts_index.json from data directory."""
+def load_skills(ledger_path: Path, active_only: bool = False, *,
+                buffer: Optional[bytes] = None) -> Tuple[Dict, Path]:
+    """
+    Load skills.yaml from ledger. Returns (skills_data, skills_file_path).
+
+    Pass buffer (the file's bytes) when the caller has already read the file,
+    so it is not read from disk a second time. Without a buffer, parses are
+    memoized per (path, mtime, size); every call still returns its own copy.
+    """
+    skills_file = find_skills_file(ledger_path, active_only)
+    if buffer is None:
+        stat = skills_file.stat()
+        return pickle.loads(_load_skills_pickled(str(skills_file), stat.st_mtime_ns, stat.st_size)), skills_file
+    import yaml
+    return yaml.load(buffer, Loader=_yaml_loader()), skills_file
+
+
+@functools.lru_cache(maxsize=4)
+def _load_skills_pickled(path: str, mtime_ns: int, size: int) -> bytes:
+    """Parse a skills file to pickled bytes; the stat fields in the key invalidate stale entries."""
+    import yaml
+    with open(path, 'rb') as f:
+        data = yaml.load(f.read(), Loader=_yaml_loader())
+    # Immutable bytes, so no caller can change a shared parse; unpickling
+    # a private copy is ~50x faster than parsing the YAML again
+    return pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def find_transcripts_index(transcripts_path: Path) -> Path:
+    """Locate transcripts_index.json relative to the data directory."""
     # Check multiple possible locations
     possible_paths = [
         transcripts_path.parent / "transcripts_index.json",
@@ -55,16 +105,59 @@ def load_transcripts_index(transcripts_path: Path) -> Dict:
 
     for index_path in possible_paths:
         if index_path.exists():
-            with open(index_path, 'r') as f:
-                return json.load(f)
+            return index_path
 
     raise FileNotFoundError(f"transcripts_index.json not found in any expected location: {possible_paths}")
 
 
-def build_skill_line_references(yaml_file_path: Path) -> Dict[str, Dict]:
+def load_transcripts_index(transcripts_path: Path) -> Dict:
+    """Load transcripts_index.json from data directory."""
+    with open(find_transcripts_index(transcripts_path), 'r') as f:
+        return json.load(f)
+
+
+def build_project_index(transcripts_index: Dict) -> Dict[str, List[int]]:
+    """Map lowercased project_id -> positions of its entries in transcripts_index['index']."""
+    project_index = {}
+    for position, entry in enumerate(transcripts_index.get('index', [])):
+        project_id = entry.get('tags', {}).get('project_id', '')
+        project_index.setdefault(project_id.lower(), []).append(position)
+    return project_index
+
+
+def cached_project_index(index_path: Path, transcripts_index: Dict) -> Dict[str, List[int]]:
+    """
+    Return build_project_index(transcripts_index), memoized on disk.
+
+    The cache is keyed by index_path and invalidated when the file's mtime or
+    size changes.
+    """
+    source_stat = stat_key(index_path)
+    cache_file = cache_path('project_index', index_path)
+
+    cached = read_cache(cache_file)
+    if source_stat is not None and cached and cached.get('source_stat') == source_stat and 'projects' in cached:
+        return cached['projects']
+
+    project_index = build_project_index(transcripts_index)
+    if source_stat is not None:
+        write_cache(cache_file, {'source_stat': source_stat, 'projects': project_index})
+    return project_index
+
+
+def build_skill_line_references(yaml_file_path: Path, *,
+                                buffer: Optional[bytes] = None,
+                                target_names: Optional[Set[str]] = None) -> Dict[str, Dict]:
     """
     Build a mapping of skill names to their line numbers in the YAML file.
 
+    Walks the YAML event stream (LibYAML when available), so line numbers come
+    straight from the parser marks instead of a second regex pass over the text.
+    Pass buffer to scan bytes already read from yaml_file_path; without one,
+    full scans are memoized per (path, mtime, size) and each call gets its
+    own copy. When target_names (lowercased) is given, only those skills are
+    recorded and the scan stops once every target's block has closed.
+
     Returns:
         Dict mapping skill_name -> {
             'file': relative path from repo root,
@@ -73,103 +166,288 @@ def build_skill_line_references(yaml_file_path: Path) -> Dict[str, Dict]:
             'evidence_end': line where evidence array ends
         }
     """
-    references = {}
+    import yaml
 
-    with open(yaml_file_path, 'r') as f:
-        lines = f.readlines()
-
-    current_skill = None
-    skill_start_line = None
-    skill_base_indent = None
-    evidence_start_line = None
-    evidence_base_indent = None
-
-    for i, line in enumerate(lines, start=1):
-        # Match skill definition: "- skill: <name>" or "  - skill: <name>"
-        skill_match = re.match(r'^(\s*)- skill:\s*(.+)$', line)
-        if skill_match:
-            # Save previous skill's evidence end if we were tracking one
-            if current_skill and evidence_start_line:
-                references[current_skill]['evidence_end'] = i - 1
-
-            skill_base_indent = len(skill_match.group(1))
-            skill_name = skill_match.group(2).strip()
-            current_skill = skill_name
-            skill_start_line = i
-            evidence_start_line = None
-            evidence_base_indent = None
-
-            references[skill_name] = {
-                'file': f"ledger/{yaml_file_path.name}",
-                'definition_line': skill_start_line,
-                'evidence_start': None,
-                'evidence_end': None
-            }
+    references = {}
+    ref_file = f"ledger/{yaml_file_path.name}"
+
+    # One frame per open collection: [is_mapping, nodes_seen, last_key, key_line, skill_name]
+    stack = []
+    evidence_frame = None
+    evidence_skill = None
+    evidence_flow = False
+    pending = set(target_names) if target_names is not None else None
+
+    if buffer is None:
+        if target_names is None:
+            stat = yaml_file_path.stat()
+            cached = _line_references_cached(yaml_file_path, stat.st_mtime_ns, stat.st_size)
+            # References hold only scalars, so copying each entry copies them fully
+            return {name: dict(ref) for name, ref in cached.items()}
+        buffer = yaml_file_path.read_bytes()
+
+    for event in yaml.parse(buffer, Loader=_yaml_loader()):
+        if isinstance(event, yaml.CollectionEndEvent):
+            frame = stack.pop()
+            if frame is evidence_frame:
+                # Block sequences end where the next token starts, so the
+                # 0-based mark line is the 1-based line of the last item
+                if evidence_flow:
+                    end_line = event.end_mark.line + 1
+                else:
+                    end_line = event.start_mark.line
+                references[evidence_skill]['evidence_end'] = end_line
+                evidence_frame = None
+            if pending is not None and frame[4] is not None:
+                pending.discard(frame[4].lower())
+                if not pending:
+                    break
+            if stack:
+                stack[-1][1] += 1
             continue
 
-        # Match evidence array start: "evidence:" or "  evidence:"
-        # Note: evidence can be a string (single line) or array (multi-line)
-        if current_skill and re.match(r'^(\s+)evidence:\s*$', line):
-            evidence_match = re.match(r'^(\s+)evidence:\s*$', line)
-            evidence_base_indent = len(evidence_match.group(1))
-            evidence_start_line = i
-            references[current_skill]['evidence_start'] = evidence_start_line
+        if not isinstance(event, yaml.NodeEvent):
             continue
 
-        # Check if we've moved to a new skill property at the same level or moved to next skill
-        if evidence_start_line and evidence_base_indent is not None:
-            # Get leading spaces of current line
-            leading_spaces_match = re.match(r'^(\s*)', line)
-            leading_spaces = len(leading_spaces_match.group(1)) if leading_spaces_match else 0
+        parent = stack[-1] if stack else None
+        opens_evidence = False
+
+        if parent is not None and parent[0]:
+            if parent[1] % 2 == 0:
+                # Mapping key
+                parent[2] = event.value if isinstance(event, yaml.ScalarEvent) else None
+                parent[3] = event.start_mark.line + 1
+            elif (parent[1] == 1 and parent[2] == 'skill'
+                  and isinstance(event, yaml.ScalarEvent)
+                  and len(stack) > 1 and not stack[-2][0]):
+                # "- skill: <name>" as the first key of a list item
+                skill_name = event.value.strip()
+                if pending is None or skill_name.lower() in pending:
+                    parent[4] = skill_name
+                    references[skill_name] = {
+                        'file': ref_file,
+                        'definition_line': parent[3],
+                        'evidence_start': None,
+                        'evidence_end': None
+                    }
+            elif (parent[2] == 'evidence' and parent[4]
+                  and isinstance(event, yaml.SequenceStartEvent)):
+                # Evidence can be a string (no range) or an array (range)
+                references[parent[4]]['evidence_start'] = parent[3]
+                evidence_skill = parent[4]
+                opens_evidence = True
+
+        if isinstance(event, yaml.CollectionStartEvent):
+            frame = [isinstance(event, yaml.MappingStartEvent), 0, None, 0, None]
+            if opens_evidence:
+                evidence_frame = frame
+                evidence_flow = bool(event.flow_style)
+            stack.append(frame)
+        elif parent is not None:
+            parent[1] += 1
+
+    return references
+
 
-            # If line is non-empty and at same or lower indent than evidence:, we've left the array
-            if line.strip() and leading_spaces <= evidence_base_indent:
-                # Check if it's not just continuation of a multi-line string
-                if not line.lstrip().startswith('- '):  # Not a list item
-                    references[current_skill]['evidence_end'] = i - 1
-                    evidence_start_line = None
-                    evidence_base_indent = None
+@functools.lru_cache(maxsize=4)
+def _line_references_cached(yaml_file_path: Path, mtime_ns: int, size: int) -> Dict[str, Dict]:
+    """Full-file line references; the stat fields in the key invalidate stale entries."""
+    return build_skill_line_references(yaml_file_path, buffer=yaml_file_path.read_bytes())
 
-    # Handle last skill if it had evidence
-    if current_skill and evidence_start_line:
-        references[current_skill]['evidence_end'] = len(lines)
 
+def _split_skill_categories(buffer: bytes) -> List[Tuple[int, bytes]]:
+    """
+    Split the top-level 'skills:' section into one chunk per category.
+
+    Returns (line_offset, chunk_bytes) pairs covering the whole buffer, where
+    line_offset is the number of lines before the chunk. Each chunk is a
+    standalone YAML mapping, e.g. '  orchestration:\n    - skill: ...'; the
+    text before and after the section forms the first and last chunks.
+    Returns [] when there is no skills section to split.
+    """
+    section = _SKILLS_SECTION_RE.search(buffer)
+    if not section:
+        return []
+    start = section.end() + 1
+    next_top = _TOP_LEVEL_LINE_RE.search(buffer, start)
+    end = next_top.start() if next_top else len(buffer)
+
+    # Category headers share the indent of the first key under 'skills:'
+    first_key = re.compile(rb'^( +)[^\s#-]', re.MULTILINE).search(buffer, start, end)
+    if not first_key:
+        return []
+    indent = len(first_key.group(1))
+    header_re = re.compile(rb'^ {%d}[^\s#-]' % indent, re.MULTILINE)
+    headers = [m.start() for m in header_re.finditer(buffer, start, end)]
+
+    bounds = [(0, section.start())] + list(zip(headers, headers[1:] + [end])) + [(end, len(buffer))]
+    return [(buffer.count(b'\n', 0, lo), buffer[lo:hi]) for lo, hi in bounds if hi > lo]
+
+
+def _scan_chunk(file_name: str, line_offset: int, chunk: bytes) -> Dict[str, Dict]:
+    """Process-pool worker: line references for one category chunk, in file coordinates."""
+    references = build_skill_line_references(Path(file_name), buffer=chunk)
+    for ref in references.values():
+        for key in ('definition_line', 'evidence_start', 'evidence_end'):
+            if ref[key] is not None:
+                ref[key] += line_offset
     return references
 
 
-def extract_all_skills(skills_data: Dict) -> List[Dict]:
-    """Extract all skills from nested structure with their metadata."""
-    all_skills = []
+def build_skill_line_references_parallel(yaml_file_path: Path, *,
+                                         buffer: Optional[bytes] = None,
+                                         workers: Optional[int] = None) -> Dict[str, Dict]:
+    """
+    build_skill_line_references, scanning each skills category in its own process.
+
+    Files under PARALLEL_SCAN_MIN_BYTES, files without a splittable 'skills:'
+    section, and single-CPU hosts are scanned serially.
+    """
+    if buffer is None:
+        buffer = yaml_file_path.read_bytes()
+    chunks = _split_skill_categories(buffer) if len(buffer) >= PARALLEL_SCAN_MIN_BYTES else []
+    if workers is None:
+        workers = pool_workers(len(chunks), len(buffer), PARALLEL_SCAN_MIN_BYTES)
+    if len(chunks) < 2 or workers < 2:
+        return build_skill_line_references(yaml_file_path, buffer=buffer)
+
+    import yaml
+
+    offsets, chunk_bytes = zip(*chunks)
+    references = {}
+    try:
+        with process_pool(workers) as executor:
+            # Merge in file order so later duplicates win, as in the serial scan
+            for part in executor.map(_scan_chunk, repeat(yaml_file_path.name), offsets, chunk_bytes):
+                references.update(part)
+    except yaml.YAMLError:
+        # A category that only parses in full-file context; the serial scan is authoritative
+        return build_skill_line_references(yaml_file_path, buffer=buffer)
+    return references
+
+
+def cached_skill_line_references(yaml_file_path: Path, *,
+                                 buffer: Optional[bytes] = None,
+                                 target_names: Optional[Set[str]] = None) -> Dict[str, Dict]:
+    """
+    Return build_skill_line_references(yaml_file_path), memoized on disk.
+
+    One cache file per ledger path, validated by a BLAKE2b digest of the file
+    contents so edits always invalidate it regardless of mtime. On a miss with
+    target_names, only the targets are scanned and nothing is cached.
+    """
+    cache_file = cache_path('skill_refs', yaml_file_path)
+    if buffer is None:
+        buffer = yaml_file_path.read_bytes()
+    digest = hashlib.blake2b(buffer, digest_size=16).hexdigest()
+
+    cached = read_cache(cache_file)
+    if cached and cached.get('digest') == digest and 'references' in cached:
+        return cached['references']
+
+    if target_names is not None:
+        return build_skill_line_references(yaml_file_path, buffer=buffer,
+                                           target_names=target_names)
+
+    references = build_skill_line_references_parallel(yaml_file_path, buffer=buffer)
+    write_cache(cache_file, {'source': str(yaml_file_path.resolve()), 'digest': digest,
+                              'references': references})
+    return references
+
 
+def _iter_skill_entries(skills_data: Dict) -> Iterator[Tuple[str, str, Dict]]:
+    """Yield (name, category, skill_entry) for every skill, without copying entries."""
     if 'skills' not in skills_data:
-        return all_skills
-
-    def process_skill_list(skill_list, category, subcategory=None):
-        """Helper to process a list of skills."""
-        for skill_entry in skill_list:
-            if isinstance(skill_entry, dict) and 'skill' in skill_entry:
-                skill_info = {
-                    'name': skill_entry['skill'],
-                    'category': f"{category}/{subcategory}" if subcategory else category,
-                    'level': skill_entry.get('level', 0),
-                    'evidence': skill_entry.get('evidence', ''),
-                    'evidence_sessions': skill_entry.get('evidence_sessions', []),  # IAW Issue #71
-                    'temporal_metadata': skill_entry.get('temporal_metadata', {})
-                }
-                all_skills.append(skill_info)
+        return
 
     # Iterate through categories
     for category, category_data in skills_data['skills'].items():
         if isinstance(category_data, list):
             # Direct list of skills (e.g., orchestration)
-            process_skill_list(category_data, category)
+            groups = ((category, category_data),)
         elif isinstance(category_data, dict):
             # Nested structure with subcategories (e.g., tech_stack -> frameworks)
-            for subcategory, skill_list in category_data.items():
-                if isinstance(skill_list, list):
-                    process_skill_list(skill_list, category, subcategory)
+            groups = ((f"{category}/{subcategory}", skill_list)
+                      for subcategory, skill_list in category_data.items()
+                      if isinstance(skill_list, list))
+        else:
+            continue
+
+        for category_name, skill_list in groups:
+            for skill_entry in skill_list:
+                if isinstance(skill_entry, dict) and 'skill' in skill_entry:
+                    yield skill_entry['skill'], category_name, skill_entry
 
-    return all_skills
+
+def extract_all_skills(skills_data: Dict) -> List[Dict]:
+    """Extract all skills from nested structure with their metadata."""
+    return [
+        {
+            'name': name,
+            'category': category,
+            'level': skill_entry.get('level', 0),
+            'evidence': skill_entry.get('evidence', ''),
+            'evidence_sessions': skill_entry.get('evidence_sessions', []),  # IAW Issue #71
+            'temporal_metadata': skill_entry.get('temporal_metadata', {})
+        }
+        for name, category, skill_entry in _iter_skill_entries(skills_data)
+    ]
+
+
+class SkillRow(NamedTuple):
+    """Flattened skill record; one per '- skill:' entry in the ledger."""
+    name: str
+    category: str
+    level: int
+    confidence: float
+    trend: str
+    session_count: int
+    evidence_quality: str
+    evidence: object
+    evidence_sessions: List
+
+
+def flatten_skills(skills_data: Dict) -> List[SkillRow]:
+    """Flatten the nested skills tree into one row per skill, in ledger order."""
+    rows = []
+    for name, category, entry in _iter_skill_entries(skills_data):
+        meta_get = entry.get('temporal_metadata', {}).get
+        rows.append(SkillRow(
+            name=name,
+            category=category,
+            level=entry.get('level', 0),
+            confidence=meta_get('confidence_score', 0),
+            trend=meta_get('trend', 'unknown'),
+            session_count=meta_get('session_count', 0),
+            evidence_quality=meta_get('evidence_quality', 'unknown'),
+            evidence=entry.get('evidence', ''),
+            evidence_sessions=entry.get('evidence_sessions', [])
+        ))
+    return rows
+
+
+def _find_skill(skills_data: Dict, name_lc: str) -> Optional[Tuple[str, str, Dict]]:
+    """
+    Return the first (name, category, skill_entry) whose name matches name_lc, else None.
+
+    Walks the skills in ledger order and stops at the hit, so the first
+    definition of a duplicated name wins.
+    """
+    for entry in _iter_skill_entries(skills_data):
+        if entry[0].lower() == name_lc:
+            return entry
+    return None
+
+
+def _format_references(ref: Dict) -> Dict:
+    """Render a line reference as 'file:line' strings for query output."""
+    references = {
+        'definition': f"{ref['file']}:{ref['definition_line']}",
+        'evidence_source': None
+    }
+    if ref['evidence_start'] and ref['evidence_end']:
+        references['evidence_source'] = f"{ref['file']}:{ref['evidence_start']}-{ref['evidence_end']}"
+    return references
 
 
 def query_by_skill(skill_name: str, skills_data: Dict, transcripts_index: Dict,
@@ -184,28 +462,24 @@ def query_by_skill(skill_name: str, skills_data: Dict, transcripts_index: Dict,
         line_references: Optional file:line references to YAML sources
         with_evidence_sessions: If True, include evidence_sessions in results (IAW Issue #71)
     """
-    all_skills = extract_all_skills(skills_data)
-
     # Find matching skill (case-insensitive)
-    matching_skill = None
-    for skill in all_skills:
-        if skill['name'].lower() == skill_name.lower():
-            matching_skill = skill
-            break
+    hit = _find_skill(skills_data, skill_name.lower())
 
-    if not matching_skill:
+    if not hit:
         return {
             'error': f"Skill '{skill_name}' not found in ledger",
-            'available_skills': [s['name'] for s in all_skills[:10]]  # Show first 10 as hint
+            'available_skills': [name for name, _, _ in islice(_iter_skill_entries(skills_data), 10)]  # Show first 10 as hint
         }
 
-    temporal_meta = matching_skill.get('temporal_metadata', {})
+    name, category, skill_entry = hit
+
+    temporal_meta = skill_entry.get('temporal_metadata', {})
     confidence = temporal_meta.get('confidence_score', 0)
     trend = temporal_meta.get('trend', 'unknown')
     session_count = temporal_meta.get('session_count', 0)
 
     # Extract evidence_sessions if available (IAW Issue #71)
-    evidence_sessions = matching_skill.get('evidence_sessions', [])
+    evidence_sessions = skill_entry.get('evidence_sessions', [])
 
     result = {
         'query': {
@@ -216,11 +490,11 @@ def query_by_skill(skill_name: str, skills_data: Dict, transcripts_index: Dict,
         'results': {
             'skill_confidence': confidence,
             'skill_trend': trend,
-            'skill_level': matching_skill['level'],
-            'skill_category': matching_skill['category'],
+            'skill_level': skill_entry.get('level', 0),
+            'skill_category': category,
             'session_count': session_count,
             'sessions': evidence_sessions if with_evidence_sessions else [],
-            'evidence': matching_skill['evidence']
+            'evidence': skill_entry.get('evidence', '')
         }
     }
 
@@ -230,15 +504,8 @@ def query_by_skill(skill_name: str, skills_data: Dict, transcripts_index: Dict,
         result['results']['evidence_sessions_count'] = len(evidence_sessions)
 
     # Add line references if available
-    if line_references and matching_skill['name'] in line_references:
-        ref = line_references[matching_skill['name']]
-        result['results']['references'] = {
-            'definition': f"{ref['file']}:{ref['definition_line']}",
-            'evidence_source': None
-        }
-        if ref['evidence_start'] and ref['evidence_end']:
-            result['results']['references']['evidence_source'] = \
-                f"{ref['file']}:{ref['evidence_start']}-{ref['evidence_end']}"
+    if line_references and name in line_references:
+        result['results']['references'] = _format_references(line_references[name])
 
     return result
 
@@ -246,39 +513,32 @@ def query_by_skill(skill_name: str, skills_data: Dict, transcripts_index: Dict,
 def query_by_confidence(threshold: int, skills_data: Dict,
                        line_references: Optional[Dict] = None) -> Dict:
     """Find all skills below confidence threshold."""
-    all_skills = extract_all_skills(skills_data)
-
+    rows = flatten_skills(skills_data)
+    refs_get = (line_references or {}).get
     low_confidence_skills = []
-    for skill in all_skills:
-        temporal_meta = skill.get('temporal_metadata', {})
-        confidence = temporal_meta.get('confidence_score', 0)
-
-        if confidence < threshold and confidence > 0:  # Exclude 0 (no data)
-            skill_entry = {
-                'skill_name': skill['name'],
-                'confidence': confidence,
-                'level': skill['level'],
-                'category': skill['category'],
-                'trend': temporal_meta.get('trend', 'unknown'),
-                'session_count': temporal_meta.get('session_count', 0),
-                'evidence_quality': temporal_meta.get('evidence_quality', 'unknown')
-            }
-
-            # Add line references if available
-            if line_references and skill['name'] in line_references:
-                ref = line_references[skill['name']]
-                skill_entry['references'] = {
-                    'definition': f"{ref['file']}:{ref['definition_line']}",
-                    'evidence_source': None
-                }
-                if ref['evidence_start'] and ref['evidence_end']:
-                    skill_entry['references']['evidence_source'] = \
-                        f"{ref['file']}:{ref['evidence_start']}-{ref['evidence_end']}"
-
-            low_confidence_skills.append(skill_entry)
+    for row in rows:
+        if not 0 < row.confidence < threshold:  # Exclude 0 (no data)
+            continue
+
+        skill_entry = {
+            'skill_name': row.name,
+            'confidence': row.confidence,
+            'level': row.level,
+            'category': row.category,
+            'trend': row.trend,
+            'session_count': row.session_count,
+            'evidence_quality': row.evidence_quality
+        }
+
+        # Add line references if available
+        ref = refs_get(row.name)
+        if ref:
+            skill_entry['references'] = _format_references(ref)
+
+        low_confidence_skills.append(skill_entry)
 
     # Sort by confidence (lowest first)
-    low_confidence_skills.sort(key=lambda x: x['confidence'])
+    low_confidence_skills.sort(key=itemgetter('confidence'))
 
     return {
         'query': {
@@ -297,24 +557,39 @@ def query_by_confidence(threshold: int, skills_data: Dict,
     }
 
 
-def query_by_project(project_name: str, transcripts_index: Dict) -> Dict:
-    """Find all sessions for a specific project."""
-    matching_sessions = []
+def query_by_project(project_name: str, transcripts_index: Dict,
+                     project_index: Optional[Dict[str, List[int]]] = None) -> Dict:
+    """
+    Find all sessions for a specific project.
+
+    project_index (from build_project_index) lets the substring match run once
+    per distinct project_id instead of once per session.
+    """
+    entries = transcripts_index.get('index', [])
+    if project_index is None:
+        project_index = build_project_index(transcripts_index)
+
+    # Simple substring match for now
+    name_lc = project_name.lower()
+    positions = sorted(
+        position
+        for project_id_lc, project_positions in project_index.items()
+        if name_lc in project_id_lc
+        for position in project_positions
+    )
 
-    for entry in transcripts_index.get('index', []):
+    matching_sessions = []
+    for position in positions:
+        entry = entries[position]
         tags = entry.get('tags', {})
-        project_id = tags.get('project_id', '')
-
-        # Simple substring match for now
-        if project_name.lower() in project_id.lower():
-            matching_sessions.append({
-                'session_id': entry.get('session_id', ''),
-                'date': entry.get('created_date', ''),
-                'file_path': entry.get('file_path', ''),
-                'project_id': project_id,
-                'workflows': tags.get('workflow', []),
-                'technical_tags': tags.get('technical', [])
-            })
+        matching_sessions.append({
+            'session_id': entry.get('session_id', ''),
+            'date': entry.get('created_date', ''),
+            'file_path': entry.get('file_path', ''),
+            'project_id': tags.get('project_id', ''),
+            'workflows': tags.get('workflow', []),
+            'technical_tags': tags.get('technical', [])
+        })
 
     return {
         'query': {
@@ -329,22 +604,42 @@ def query_by_project(project_name: str, transcripts_index: Dict) -> Dict:
     }
 
 
+def _session_in_window(date_str: str, cutoff: datetime, cutoff_aware: datetime,
+                       cutoff_utc: Optional[str] = None) -> bool:
+    """
+    True if an ISO8601 session date is on or after the cutoff; unparseable dates are excluded.
+
+    cutoff_utc is the cutoff as 'YYYY-MM-DDTHH:MM:SS' in UTC. Canonical UTC
+    dates ('...THH:MM:SS[.ffffff]Z') sort chronologically as text, so they are
+    decided by string comparison unless they fall in the cutoff's own second.
+    """
+    if not date_str:
+        return False
+    if (cutoff_utc and len(date_str) >= 20 and date_str[-1] == 'Z'
+            and date_str[4] == '-' and date_str[10] == 'T' and date_str[16] == ':'):
+        prefix = date_str[:19]
+        if prefix != cutoff_utc:
+            return prefix > cutoff_utc
+    try:
+        session_date = datetime.fromisoformat(
+            date_str[:-1] + '+00:00' if date_str.endswith('Z') else date_str)
+    except (ValueError, TypeError):
+        return False
+    # Naive dates are local time; offset-aware dates compare against the aware cutoff
+    return session_date >= (cutoff if session_date.tzinfo is None else cutoff_aware)
+
+
 def filter_by_time_window(results: Dict, days: int) -> Dict:
     """Filter sessions to last N days."""
     cutoff_date = datetime.now() - timedelta(days=days)
+    cutoff_aware = cutoff_date.astimezone()
+    cutoff_utc = cutoff_aware.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S')
 
     if 'results' in results and 'sessions' in results['results']:
-        filtered_sessions = []
-        for session in results['results']['sessions']:
-            session_date_str = session.get('date', '')
-            if session_date_str:
-                try:
-                    # Parse ISO8601 timestamp
-                    session_date = datetime.fromisoformat(session_date_str.replace('Z', '+00:00'))
-                    if session_date >= cutoff_date:
-                        filtered_sessions.append(session)
-                except (ValueError, AttributeError):
-                    continue
+        filtered_sessions = [
+            session for session in results['results']['sessions']
+            if _session_in_window(session.get('date', ''), cutoff_date, cutoff_aware, cutoff_utc)
+        ]
 
         results['results']['sessions'] = filtered_sessions
         results['results']['session_count'] = len(filtered_sessions)
@@ -353,9 +648,23 @@ def filter_by_time_window(results: Dict, days: int) -> Dict:
     return results
 
 
-def format_as_json(results: Dict) -> str:
-    """Format results as pretty JSON."""
-    return json.dumps(results, indent=2)
+def limit_results(results: Dict, limit: int) -> Dict:
+    """Keep only the first N sessions/skills; counts still report the full match."""
+    result_rows = results.get('results', {})
+    for key in ('sessions', 'skills'):
+        if key in result_rows:
+            result_rows[key] = result_rows[key][:limit]
+    if 'query' in results:
+        results['query']['filters']['limit'] = limit
+    return results
+
+
+def format_as_json(results: Dict, pretty: bool = False) -> str:
+    """Format results as compact JSON, or indented JSON when pretty is set."""
+    # default=str covers dates PyYAML loads from unquoted ledger values
+    if pretty:
+        return json.dumps(results, indent=2, default=str)
+    return json.dumps(results, separators=(',', ':'), default=str)
 
 
 def format_as_table(results: Dict) -> str:
@@ -363,7 +672,7 @@ def format_as_table(results: Dict) -> str:
     try:
         from tabulate import tabulate
     except ImportError:
-        return "Error: tabulate not installed. Run: pip install tabulate\n" + format_as_json(results)
+        return "Error: tabulate not installed. Run: pip install tabulate\n" + format_as_json(results, pretty=True)
 
     if 'error' in results:
         return f"Error: {results['error']}\n"
@@ -387,7 +696,7 @@ def format_as_table(results: Dict) -> str:
             ]
             for s in skills
         ]
-        return tabulate(rows, headers=headers, tablefmt='grid')
+        return tabulate(rows, headers=headers, tablefmt='simple')
 
     elif query_type == 'skill':
         info = results.get('results', {})
@@ -432,7 +741,7 @@ def format_as_table(results: Dict) -> str:
             ]
             for s in sessions
         ]
-        return tabulate(rows, headers=headers, tablefmt='grid')
+        return tabulate(rows, headers=headers, tablefmt='simple')
 
 
 def format_as_markdown(results: Dict) -> str:
@@ -498,8 +807,12 @@ def main():
                        help='Find skills below confidence threshold (0-100)')
     parser.add_argument('--last-n-days', type=int, metavar='N',
                        help='Filter to sessions in last N days')
+    parser.add_argument('--limit', type=int, metavar='N',
+                       help='Show at most N sessions/skills')
     parser.add_argument('--format', choices=['json', 'table', 'markdown'],
                        default='json', help='Output format (default: json)')
+    parser.add_argument('--pretty', action='store_true',
+                       help='Indent JSON output for reading (default: compact)')
     parser.add_argument('--with-ref', action='store_true',
                        help='Include file:line references to YAML sources')
     parser.add_argument('--with-evidence-sessions', action='store_true',
@@ -525,9 +838,14 @@ def main():
 
     try:
         # Load data sources
-        skills_data, skills_file = load_skills(ledger_path)
+        # Read the ledger once; parsing and line references share the bytes
+        skills_file = find_skills_file(ledger_path)
+        skills_raw = skills_file.read_bytes()
+        skills_data, _ = load_skills(ledger_path, buffer=skills_raw)
         # transcripts_index is optional and may not exist yet
+        transcripts_index_path = None
         try:
+            transcripts_index_path = find_transcripts_index(transcripts_path)
             transcripts_index = load_transcripts_index(transcripts_path)
         except FileNotFoundError:
             transcripts_index = {}  # Use empty dict if not found
@@ -535,14 +853,20 @@ def main():
         # Build line references if requested
         line_references = None
         if args.with_ref:
-            line_references = build_skill_line_references(skills_file)
+            # A single --skill lookup only needs that skill's block
+            target_names = {args.skill.lower()} if args.skill else None
+            line_references = cached_skill_line_references(skills_file, buffer=skills_raw,
+                                                           target_names=target_names)
 
         # Execute query
         if args.skill:
             results = query_by_skill(args.skill, skills_data, transcripts_index,
                                     line_references, args.with_evidence_sessions)
         elif args.project:
-            results = query_by_project(args.project, transcripts_index)
+            project_index = None
+            if transcripts_index_path:
+                project_index = cached_project_index(transcripts_index_path, transcripts_index)
+            results = query_by_project(args.project, transcripts_index, project_index)
         elif args.confidence_below:
             results = query_by_confidence(args.confidence_below, skills_data, line_references)
         else:
@@ -552,9 +876,13 @@ def main():
         if args.last_n_days:
             results = filter_by_time_window(results, args.last_n_days)
 
+        if args.limit is not None:
+            results = limit_results(results, args.limit)
+
         # Format and print output
         if args.format == 'json':
-            print(format_as_json(results))
+            sys.stdout.write(format_as_json(results, pretty=args.pretty))
+            sys.stdout.write('\n')
         elif args.format == 'table':
             print(format_as_table(results))
         elif args.format == 'markdown':
@@ -6,30 +6,108 @@ Extracts session-level metadata from CLI transcripts and updates sessions.yaml.
 Part of Issue #45: Add session activity tracking to ledger.
 """
 
-import json
 import yaml
 import re
 import os
+import sys
 import argparse
+import contextlib
+import io
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from itertools import islice, repeat
+from typing import Dict, List, Optional, Set, Tuple
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from packages.common.parallel import file_size, pool_workers, process_pool
+from packages.common.serialization import YAML_DUMPER, YAML_LOADER, loads_json
+
+
+# Content patterns that reveal a working directory, tried in order
+WORKING_DIR_PATTERNS = [
+    re.compile(p, re.IGNORECASE) for p in (
+        r"Working directory:\s*([^\n]+)",
+        r"cwd:\s*([^\n]+)",
+        r"pwd:\s*([^\n]+)",
+        r"cd\s+([^\s\n]+)",
+        r"directory:\s*([^\n]+)",
+    )
+]
+# One-pass prefilter: the literal each working-directory pattern needs
+_WORKING_DIR_HINT_RE = re.compile(r"directory:|cwd:|pwd:|cd\s", re.IGNORECASE)
+_QUOTE_STRIP_TABLE = str.maketrans("", "", "`\"'")
+
+# Simplified skill patterns (subset of skill_ingestion.py patterns)
+SKILL_PATTERNS = {
+    skill_name: [re.compile(p, re.IGNORECASE) for p in patterns]
+    for skill_name, patterns in {
+        "Project Management": [
+            r"issue\s+\d+",
+            r"GitHub\s+issue",
+            r"tracking\s+progress",
+            r"todo\s+list",
+            r"milestone",
+        ],
+        "Critical Thinking & Evaluation": [
+            r"analyze\s+options",
+            r"evaluate\s+approach",
+            r"trade[-\s]?offs?",
+            r"consider\s+alternatives",
+        ],
+        "GitHub MCP Integration": [
+            r"gh\s+issue",
+            r"gh\s+pr",
+            r"github\s+api",
+            r"create\s+issue",
+        ],
+        "Pattern Recognition": [
+            r"recurring\s+pattern",
+            r"common\s+pattern",
+            r"identify\s+pattern",
+        ],
+        "Documentation & Knowledge Capture": [
+            r"document(?:ing|ed)",
+            r"write\s+(?:readme|docs?|guide)",
+            r"update\s+documentation",
+        ],
+    }.items()
+}
+
+# Legacy batches at least this large are analyzed in a process pool
+PARALLEL_TRANSCRIPT_MIN_BYTES = 1 << 20
+
+# Required top-level keys of a transcript, per the AGENTS.md session contract
+REQUIRED_TRANSCRIPT_FIELDS = frozenset(("session_id", "start_time", "interactions"))
+
+# ISO-8601 parser; Python 3.11+ accepts a trailing 'Z' natively
+if sys.version_info >= (3, 11):
+    _parse_iso = datetime.fromisoformat
+else:
+    def _parse_iso(value: str) -> datetime:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+# Transcripts starting within 4 hours of a session may continue it
+CONTINUATION_WINDOW_SECONDS = 4 * 60 * 60
+
+_PARENS_RE = re.compile(r'\([^)]*\)')
+_DATE_RE = re.compile(r'(\d{6,8})')
+# ASCII bytes that are not [a-zA-Z0-9], deleted via bytes.translate
+_NON_ALNUM_BYTES = bytes(c for c in range(128) if not chr(c).isalnum())
 
 
 def parse_history_jsonl(history_path: Path) -> Dict[str, List[Dict]]:
     """Parse history.jsonl and group by session ID."""
     sessions = {}
     try:
-        with open(history_path, 'r') as f:
+        with open(history_path, 'rb', buffering=1 << 20) as f:
             for line in f:
                 if not line.strip():
                     continue
-                entry = json.loads(line)
+                entry = loads_json(line)
                 session_id = entry.get("sessionId")
                 if session_id:
-                    if session_id not in sessions:
-                        sessions[session_id] = []
-                    sessions[session_id].append(entry)
+                    sessions.setdefault(session_id, []).append(entry)
     except Exception as e:
         print(f"❌ Error parsing {history_path}: {e}")
         return {}
@@ -41,11 +119,16 @@ def convert_history_session_to_transcript(session_id: str, entries: List[Dict])
     if not entries:
         return {}
 
-    # Sort by timestamp
-    sorted_entries = sorted(entries, key=lambda x: x.get("timestamp", 0))
+    # Sort by timestamp; history.jsonl is append-ordered, so usually a no-op
+    keys = [e.get("timestamp", 0) for e in entries]
+    if all(a <= b for a, b in zip(keys, islice(keys, 1, None))):
+        sorted_entries = entries
+    else:
+        sorted_entries = sorted(entries, key=lambda x: x.get("timestamp", 0))
+        keys.sort()
 
     # Extract timestamps (in milliseconds)
-    timestamps = [e.get("timestamp", 0) for e in sorted_entries if e.get("timestamp")]
+    timestamps = [t for t in keys if t]
     start_time = datetime.fromtimestamp(timestamps[0] / 1000).isoformat() if timestamps else ""
     end_time = datetime.fromtimestamp(timestamps[-1] / 1000).isoformat() if timestamps else None
 
@@ -69,11 +152,11 @@ def convert_history_session_to_transcript(session_id: str, entries: List[Dict])
 def parse_transcript(transcript_path: Path) -> Optional[Dict]:
     """Parse a single transcript JSON file."""
     try:
-        with open(transcript_path, 'r') as f:
-            data = json.load(f)
+        with open(transcript_path, 'rb') as f:
+            data = loads_json(f.read())
 
         # Validate required fields per AGENTS.md session contract
-        if not all(key in data for key in ["session_id", "start_time", "interactions"]):
+        if not isinstance(data, dict) or not REQUIRED_TRANSCRIPT_FIELDS.issubset(data):
             print(f"⚠️  Missing required fields in {transcript_path.name}")
             return None
 
@@ -92,43 +175,59 @@ def extract_working_directory(interactions: List[Dict]) -> Optional[str]:
             return working_dir
 
     # Fall back to pattern matching in content
-    patterns = [
-        r"Working directory:\s*([^\n]+)",
-        r"cwd:\s*([^\n]+)",
-        r"pwd:\s*([^\n]+)",
-        r"cd\s+([^\s\n]+)",
-        r"directory:\s*([^\n]+)",
-    ]
-
     for interaction in interactions:
         content = interaction.get("content", "")
-        if not content:
+        if not content or not _WORKING_DIR_HINT_RE.search(content):
             continue
 
-        for pattern in patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
+        # Patterns are tried in priority order, not by position in content
+        for pattern in WORKING_DIR_PATTERNS:
+            match = pattern.search(content)
             if match:
                 wd = match.group(1).strip()
                 # Clean up common artifacts
-                wd = wd.replace("`", "").replace("\"", "").replace("'", "")
+                wd = wd.translate(_QUOTE_STRIP_TABLE)
                 if os.path.isabs(wd):
                     return wd
 
     return None
 
 
-def match_project_from_directory(working_dir: Optional[str], projects: List[Dict]) -> Optional[Dict]:
-    """Match working directory to a project from projects.yaml."""
-    if not working_dir:
-        return None
-
-    # Try exact match first
+def index_projects(projects: List[Dict]) -> List[Tuple[Dict, str, str, str]]:
+    """Precompute (project, lowercase name, lowercase alias, key words) per project."""
+    index = []
     for project in projects:
         name = project.get("name", "")
         alias = project.get("alias", "")
+        # Key words: project name without parenthesised content
+        key_words = _PARENS_RE.sub('', name).strip().lower()
+        index.append((project, name.lower(), alias.lower() if alias else "", key_words))
+    return index
 
+
+def match_project_from_directory(
+    working_dir: Optional[str],
+    projects: List[Dict],
+    project_index: Optional[List[Tuple[Dict, str, str, str]]] = None
+) -> Optional[Dict]:
+    """
+    Match working directory to a project from projects.yaml.
+
+    project_index (from index_projects) lets batch callers reuse the
+    lowercased names across transcripts.
+    """
+    if not working_dir:
+        return None
+    if project_index is None:
+        project_index = index_projects(projects)
+    working_dir_lower = working_dir.lower()
+
+    # Try exact match first
+    for project, name_lower, alias_lower, _ in project_index:
         # Check if working dir contains project name or alias
-        if name.lower() in working_dir.lower() or (alias and alias.lower() in working_dir.lower()):
+        if name_lower in working_dir_lower or (alias_lower and alias_lower in working_dir_lower):
+            name = project.get("name", "")
+            alias = project.get("alias", "")
             return {
                 "project_id": alias if alias else name,
                 "project_name": name,
@@ -136,12 +235,9 @@ def match_project_from_directory(working_dir: Optional[str], projects: List[Dict
             }
 
     # Try partial path matching
-    for project in projects:
-        name = project.get("name", "")
-        # Extract key words from project name (remove parentheses content)
-        key_words = re.sub(r'\([^)]*\)', '', name).strip().lower()
-
-        if key_words and key_words in working_dir.lower():
+    for project, _, _, key_words in project_index:
+        if key_words and key_words in working_dir_lower:
+            name = project.get("name", "")
             return {
                 "project_id": project.get("alias", name),
                 "project_name": name,
@@ -153,39 +249,6 @@ def match_project_from_directory(working_dir: Optional[str], projects: List[Dict
 
 def detect_skills_in_session(interactions: List[Dict]) -> List[str]:
     """Detect skills demonstrated in session using simplified pattern matching."""
-    # Simplified skill patterns (subset of skill_ingestion.py patterns)
-    skill_patterns = {
-        "Project Management": [
-            r"issue\s+\d+",
-            r"GitHub\s+issue",
-            r"tracking\s+progress",
-            r"todo\s+list",
-            r"milestone",
-        ],
-        "Critical Thinking & Evaluation": [
-            r"analyze\s+options",
-            r"evaluate\s+approach",
-            r"trade[-\s]?offs?",
-            r"consider\s+alternatives",
-        ],
-        "GitHub MCP Integration": [
-            r"gh\s+issue",
-            r"gh\s+pr",
-            r"github\s+api",
-            r"create\s+issue",
-        ],
-        "Pattern Recognition": [
-            r"recurring\s+pattern",
-            r"common\s+pattern",
-            r"identify\s+pattern",
-        ],
-        "Documentation & Knowledge Capture": [
-            r"document(?:ing|ed)",
-            r"write\s+(?:readme|docs?|guide)",
-            r"update\s+documentation",
-        ],
-    }
-
     detected_skills = set()
     combined_content = " ".join([
         interaction.get("content", "")
@@ -193,11 +256,10 @@ def detect_skills_in_session(interactions: List[Dict]) -> List[str]:
         if interaction.get("type") == "user_prompt"  # Per AGENTS.md contract
     ])
 
-    for skill_name, patterns in skill_patterns.items():
-        for pattern in patterns:
-            if re.search(pattern, combined_content, re.IGNORECASE):
-                detected_skills.add(skill_name)
-                break  # One match per skill is enough
+    # Precompiled searches, one per pattern; any() stops at a skill's first hit
+    for skill_name, patterns in SKILL_PATTERNS.items():
+        if any(pattern.search(combined_content) for pattern in patterns):
+            detected_skills.add(skill_name)
 
     return sorted(list(detected_skills))
 
@@ -234,8 +296,8 @@ def calculate_duration(start_time: str, end_time: Optional[str]) -> float:
         return 0.0
 
     try:
-        start = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
-        end = datetime.fromisoformat(end_time.replace('Z', '+00:00'))
+        start = _parse_iso(start_time)
+        end = _parse_iso(end_time)
         duration_seconds = (end - start).total_seconds()
         return round(duration_seconds / 60, 1)
     except Exception:
@@ -249,7 +311,7 @@ def load_sessions_yaml(sessions_path: Path) -> Dict:
         return {"sessions": []}
 
     with open(sessions_path, 'r') as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=YAML_LOADER)
         if not data or "sessions" not in data:
             return {"sessions": []}
         return data
@@ -258,20 +320,21 @@ def load_sessions_yaml(sessions_path: Path) -> Dict:
 def save_sessions_yaml(sessions_path: Path, data: Dict):
     """Save sessions.yaml with proper formatting."""
     with open(sessions_path, 'w') as f:
-        yaml.dump(data, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+        yaml.dump(data, f, Dumper=YAML_DUMPER, default_flow_style=False, sort_keys=False,
+                  allow_unicode=True)
 
 
-def session_exists(sessions: List[Dict], session_id: str) -> bool:
-    """Check if session_id already exists in sessions list."""
-    return any(session.get("session_id") == session_id for session in sessions)
+def index_sessions(sessions: List[Dict]) -> Dict[str, Dict]:
+    """Map session_id to session; the first entry wins for duplicate ids."""
+    index = {}
+    for session in sessions:
+        index.setdefault(session.get("session_id"), session)
+    return index
 
 
-def find_session(sessions: List[Dict], session_id: str) -> Optional[Dict]:
-    """Find and return session by session_id."""
-    for session in sessions:
-        if session.get("session_id") == session_id:
-            return session
-    return None
+def _alnum_only(text: str) -> str:
+    """Drop every character outside [a-zA-Z0-9]."""
+    return text.encode('ascii', 'ignore').translate(None, _NON_ALNUM_BYTES).decode('ascii')
 
 
 def filenames_similar(filename1: str, filename2: str) -> bool:
@@ -284,9 +347,8 @@ def filenames_similar(filename1: str, filename2: str) -> bool:
     base2 = Path(filename2).stem
 
     # Extract date patterns (YYMMDD or YYYYMMDD)
-    date_pattern = r'(\d{6,8})'
-    date1 = re.search(date_pattern, base1)
-    date2 = re.search(date_pattern, base2)
+    date1 = _DATE_RE.search(base1)
+    date2 = _DATE_RE.search(base2)
 
     # If both have dates, compare them (same date = similar)
     if date1 and date2:
@@ -294,28 +356,55 @@ def filenames_similar(filename1: str, filename2: str) -> bool:
 
     # Otherwise, check if base names are similar (fuzzy match)
     # Remove all non-alphanumeric chars and compare
-    clean1 = re.sub(r'[^a-zA-Z0-9]', '', base1.lower())
-    clean2 = re.sub(r'[^a-zA-Z0-9]', '', base2.lower())
+    clean1 = _alnum_only(base1.lower())
+    clean2 = _alnum_only(base2.lower())
 
     # Similar if one contains the other or they share significant prefix
     return (clean1 in clean2 or clean2 in clean1 or
             (len(clean1) > 10 and len(clean2) > 10 and clean1[:10] == clean2[:10]))
 
 
-def detect_continuation(new_session: Dict, existing_sessions: List[Dict]) -> Optional[str]:
+def index_continuation_candidates(
+    sessions: List[Dict]
+) -> List[Tuple[Dict, Set[str], Optional[datetime]]]:
     """
-    Detect if new_session is a continuation of an existing session.
+    Pair each session that can be continued with its interaction-ID set
+    and parsed start time (None when unparseable).
+
+    Only sessions that still carry interactions and a start_time qualify;
+    sessions ingested by this script are saved without interactions.
+    """
+    candidates = []
+    for session in sessions:
+        interactions = session.get("interactions", [])
+        start_time = session.get("start_time", "")
+        if not interactions or not start_time:
+            continue
+        ids = {interaction.get("id") for interaction in interactions if interaction.get("id")}
+        try:
+            start = _parse_iso(start_time)
+        except Exception:
+            start = None
+        candidates.append((session, ids, start))
+    return candidates
+
+
+def detect_continuation(
+    new_interactions: List[Dict],
+    new_start_time: str,
+    new_filename: str,
+    new_working_dir: Optional[str],
+    candidates: List[Tuple[Dict, Set[str], Optional[datetime]]]
+) -> Optional[str]:
+    """
+    Detect if a new session is a continuation of an existing session.
+    candidates comes from index_continuation_candidates.
     Returns the session_id of the base session if continuation detected, None otherwise.
 
     Detection strategies:
     1. Interaction ID overlap (>50% threshold)
     2. Temporal proximity + filename similarity + working directory match
     """
-    new_interactions = new_session.get("interactions", [])
-    new_start_time = new_session.get("start_time", "")
-    new_filename = new_session.get("transcript_path", "")
-    new_working_dir = new_session.get("working_directory")
-
     if not new_interactions or not new_start_time:
         return None
 
@@ -328,27 +417,16 @@ def detect_continuation(new_session: Dict, existing_sessions: List[Dict]) -> Opt
 
     # Parse new session start time
     try:
-        new_start = datetime.fromisoformat(new_start_time.replace('Z', '+00:00'))
+        new_start = _parse_iso(new_start_time)
     except Exception:
         return None
 
     # Check each existing session for continuation indicators
-    for existing in existing_sessions:
-        existing_interactions = existing.get("interactions", [])
-        existing_start_time = existing.get("start_time", "")
+    for existing, existing_ids, existing_start in candidates:
         existing_filename = existing.get("transcript_path", "")
         existing_working_dir = existing.get("working_directory")
 
-        if not existing_interactions or not existing_start_time:
-            continue
-
         # Strategy 1: Check for overlapping interaction IDs
-        existing_ids = set()
-        for interaction in existing_interactions:
-            interaction_id = interaction.get("id")
-            if interaction_id:
-                existing_ids.add(interaction_id)
-
         if new_ids and existing_ids:
             overlap = new_ids & existing_ids
             overlap_ratio = len(overlap) / len(new_ids)
@@ -358,12 +436,12 @@ def detect_continuation(new_session: Dict, existing_sessions: List[Dict]) -> Opt
                 return existing.get("session_id")
 
         # Strategy 2: Temporal proximity + filename similarity + working directory match
+        if existing_start is None:
+            continue
         try:
-            existing_start = datetime.fromisoformat(existing_start_time.replace('Z', '+00:00'))
             time_diff_seconds = abs((new_start - existing_start).total_seconds())
 
-            # Within 4 hours (14400 seconds)
-            if time_diff_seconds < 14400:
+            if time_diff_seconds < CONTINUATION_WINDOW_SECONDS:
                 # Check filename similarity
                 if filenames_similar(new_filename, existing_filename):
                     # If we have working directories, they should match
@@ -437,29 +515,16 @@ def merge_session_continuation(base_session: Dict, continuation_data: Dict) -> D
     return base_session
 
 
-def process_transcript(
+def build_session_entry(
+    transcript_data: Dict,
     transcript_path: Path,
     projects: List[Dict],
-    sessions_yaml_path: Path,
-    data_dir: Path
-) -> bool:
-    """Process a single transcript and update sessions.yaml."""
-
-    # Parse transcript
-    transcript_data = parse_transcript(transcript_path)
-    if not transcript_data:
-        return False
-
+    data_dir: Path,
+    project_index: Optional[List[Tuple[Dict, str, str, str]]] = None
+) -> Dict:
+    """Extract the sessions.yaml entry for a parsed transcript."""
     session_id = transcript_data["session_id"]
 
-    # Load existing sessions
-    sessions_data = load_sessions_yaml(sessions_yaml_path)
-
-    # Check for exact duplicates
-    if session_exists(sessions_data["sessions"], session_id):
-        print(f"⏭️  Skipping {transcript_path.name} (already ingested)")
-        return False
-
     # Extract metadata
     start_time = transcript_data.get("start_time", "")
     end_time = transcript_data.get("end_time")
@@ -471,7 +536,7 @@ def process_transcript(
 
     # Extract working directory and match project
     working_dir = extract_working_directory(interactions)
-    project_context = match_project_from_directory(working_dir, projects)
+    project_context = match_project_from_directory(working_dir, projects, project_index)
 
     # Detect skills
     skills_demonstrated = detect_skills_in_session(interactions)
@@ -485,8 +550,7 @@ def process_transcript(
     except ValueError:
         relative_path = str(transcript_path)
 
-    # Create session entry (needed for both new sessions and continuation detection)
-    session_entry = {
+    return {
         "session_id": session_id,
         "date": date,
         "start_time": start_time,
@@ -498,40 +562,116 @@ def process_transcript(
         "activity_summary": activity_summary,
         "skills_demonstrated": skills_demonstrated,
         "transcript_path": relative_path,
-        "interactions": interactions,  # Include for continuation detection
         "ingestion_metadata": {
             "ingested_at": datetime.now().isoformat(),
             "confidence": 90  # Conservative confidence score
         }
     }
 
+
+def add_session_entry(
+    session_entry: Dict,
+    interactions: List[Dict],
+    transcript_path: Path,
+    sessions_data: Dict,
+    session_index: Dict[str, Dict],
+    continuation_candidates: List[Tuple[Dict, Set[str], Optional[datetime]]]
+) -> bool:
+    """Merge session_entry into its base session or append it as a new session."""
+    session_id = session_entry["session_id"]
+
+    # Check for exact duplicates
+    if session_id in session_index:
+        print(f"⏭️  Skipping {transcript_path.name} (already ingested)")
+        return False
+
     # Check for session continuation
-    continuation_of = detect_continuation(session_entry, sessions_data["sessions"])
+    continuation_of = detect_continuation(
+        interactions, session_entry["start_time"], session_entry["transcript_path"],
+        session_entry["working_directory"], continuation_candidates
+    )
     if continuation_of:
         print(f"🔗 Detected continuation of session {continuation_of[:8]}...")
-        base_session = find_session(sessions_data["sessions"], continuation_of)
+        base_session = session_index.get(continuation_of)
         if base_session:
             merge_session_continuation(base_session, session_entry)
-            save_sessions_yaml(sessions_yaml_path, sessions_data)
             print(f"✅ Merged continuation from {transcript_path.name}")
             return True
         else:
             # Should never happen, but fallback to adding as new session
             print(f"⚠️  Continuation detected but base session not found, adding as new")
 
-    # Remove interactions from session_entry before saving (not needed in YAML)
-    session_entry.pop("interactions", None)
-
     # Append to sessions
     sessions_data["sessions"].append(session_entry)
-
-    # Save back to file
-    save_sessions_yaml(sessions_yaml_path, sessions_data)
+    session_index[session_id] = session_entry
 
     print(f"✅ Ingested session {session_id[:8]}... from {transcript_path.name}")
     return True
 
 
+def process_transcript(
+    transcript_path: Path,
+    projects: List[Dict],
+    sessions_data: Dict,
+    data_dir: Path,
+    session_index: Optional[Dict[str, Dict]] = None,
+    continuation_candidates: Optional[List[Tuple[Dict, Set[str], Optional[datetime]]]] = None,
+    project_index: Optional[List[Tuple[Dict, str, str, str]]] = None
+) -> bool:
+    """
+    Process a single transcript into the in-memory sessions data.
+
+    session_index (from index_sessions) is kept in sync with appended
+    sessions so batch callers can share it across transcripts, together
+    with continuation_candidates (from index_continuation_candidates) and
+    project_index (from index_projects).
+    Returns True when sessions_data was changed; the caller saves it.
+    """
+
+    # Parse transcript
+    transcript_data = parse_transcript(transcript_path)
+    if not transcript_data:
+        return False
+
+    if session_index is None:
+        session_index = index_sessions(sessions_data["sessions"])
+    if continuation_candidates is None:
+        continuation_candidates = index_continuation_candidates(sessions_data["sessions"])
+
+    # Skip duplicates before doing any analysis
+    if transcript_data["session_id"] in session_index:
+        print(f"⏭️  Skipping {transcript_path.name} (already ingested)")
+        return False
+
+    session_entry = build_session_entry(transcript_data, transcript_path, projects, data_dir,
+                                        project_index)
+    return add_session_entry(session_entry, transcript_data.get("interactions", []),
+                             transcript_path, sessions_data, session_index,
+                             continuation_candidates)
+
+
+def _analyze_transcript(
+    transcript_path: Path,
+    projects: List[Dict],
+    data_dir: Path,
+    project_index: List[Tuple[Dict, str, str, str]]
+) -> Tuple[Optional[Dict], List[Dict], str]:
+    """
+    Parse and analyze one transcript in a worker process.
+
+    Returns (session entry or None, interactions, captured output) so the
+    parent can print messages in file order.
+    """
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        transcript_data = parse_transcript(transcript_path)
+    if not transcript_data:
+        return None, [], output.getvalue()
+    session_entry = build_session_entry(transcript_data, transcript_path, projects, data_dir,
+                                        project_index)
+    return session_entry, transcript_data.get("interactions", []), output.getvalue()
+
+
 def main():
     parser = argparse.ArgumentParser(description="Track session activity and update sessions.yaml")
     parser.add_argument("--transcript-dir", type=Path, help="Directory containing transcript JSON files")
@@ -556,18 +696,29 @@ def main():
 
     # Load projects
     with open(projects_yaml, 'r') as f:
-        projects_data = yaml.safe_load(f)
+        projects_data = yaml.load(f, Loader=YAML_LOADER)
         projects = projects_data.get("repositories", [])
+    project_index = index_projects(projects)
 
     print(f"📂 Transcript directory: {transcript_dir}")
     print(f"📋 Projects loaded: {len(projects)}")
     print(f"📝 Sessions file: {sessions_yaml}")
     print()
 
+    # Load existing sessions once; every mode mutates them in memory and
+    # writes the file back a single time at the end.
+    sessions_data = load_sessions_yaml(sessions_yaml)
+    session_index = index_sessions(sessions_data["sessions"])
+    # Appended sessions carry no interactions, so the candidates never change
+    continuation_candidates = index_continuation_candidates(sessions_data["sessions"])
+
     # Process transcripts
     if args.transcript:
         # Single transcript mode
-        success = process_transcript(args.transcript, projects, sessions_yaml, transcript_dir)
+        success = process_transcript(args.transcript, projects, sessions_data, transcript_dir,
+                                     session_index, continuation_candidates, project_index)
+        if success:
+            save_sessions_yaml(sessions_yaml, sessions_data)
         return 0 if success else 1
     else:
         # Batch mode - check for history.jsonl first
@@ -579,17 +730,16 @@ def main():
             print(f"Found {len(sessions_dict)} unique sessions\n")
 
             ingested_count = 0
+            # One ingestion timestamp for the whole batch
+            ingested_at = datetime.now().isoformat()
             for session_id, entries in sessions_dict.items():
                 # Convert to transcript format
                 transcript_data = convert_history_session_to_transcript(session_id, entries)
                 if not transcript_data:
                     continue
 
-                # Load existing sessions
-                sessions_data = load_sessions_yaml(sessions_yaml)
-
                 # Check for duplicates
-                if session_exists(sessions_data["sessions"], session_id):
+                if session_id in session_index:
                     print(f"⏭️  Skipping session {session_id[:8]}... (already ingested)")
                     continue
 
@@ -604,7 +754,7 @@ def main():
 
                 # Extract working directory and match project
                 working_dir = extract_working_directory(interactions)
-                project_context = match_project_from_directory(working_dir, projects)
+                project_context = match_project_from_directory(working_dir, projects, project_index)
 
                 # Build minimal session entry for history.jsonl
                 session_entry = {
@@ -620,7 +770,7 @@ def main():
                     "skills_demonstrated": [],
                     "transcript_path": "history.jsonl",
                     "ingestion_metadata": {
-                        "ingested_at": datetime.now().isoformat(),
+                        "ingested_at": ingested_at,
                         "source": "history.jsonl",
                         "confidence": 70  # Lower confidence for history.jsonl sessions
                     }
@@ -628,12 +778,15 @@ def main():
 
                 # Append to sessions
                 sessions_data["sessions"].append(session_entry)
-                save_sessions_yaml(sessions_yaml, sessions_data)
+                session_index[session_id] = session_entry
 
                 project_name = project_context.get('name', 'Unknown') if project_context else 'Unknown'
                 print(f"✅ {session_id[:8]}... | {date} | {project_name} ({interaction_count} interactions)")
                 ingested_count += 1
 
+            if ingested_count:
+                save_sessions_yaml(sessions_yaml, sessions_data)
+
             print(f"\n✨ Ingested {ingested_count} new sessions from history.jsonl")
             return 0
 
@@ -647,9 +800,30 @@ def main():
         print(f"Found {len(json_files)} transcript files\n")
 
         ingested_count = 0
-        for json_file in json_files:
-            if process_transcript(json_file, projects, sessions_yaml, transcript_dir):
-                ingested_count += 1
+        workers = pool_workers(len(json_files), sum(map(file_size, json_files)), PARALLEL_TRANSCRIPT_MIN_BYTES)
+        if workers:
+            # Parse and analyze in parallel; duplicate checks, continuation
+            # merges and appends stay in this process, in file order.
+            with process_pool(workers) as executor:
+                results = executor.map(
+                    _analyze_transcript, json_files, repeat(projects),
+                    repeat(transcript_dir), repeat(project_index), chunksize=8
+                )
+                for json_file, (session_entry, interactions, output) in zip(json_files, results):
+                    print(output, end="")
+                    if session_entry and add_session_entry(
+                        session_entry, interactions, json_file, sessions_data,
+                        session_index, continuation_candidates
+                    ):
+                        ingested_count += 1
+        else:
+            for json_file in json_files:
+                if process_transcript(json_file, projects, sessions_data, transcript_dir,
+                                      session_index, continuation_candidates, project_index):
+                    ingested_count += 1
+
+        if ingested_count:
+            save_sessions_yaml(sessions_yaml, sessions_data)
 
         print(f"\n✨ Ingested {ingested_count} new sessions")
         return 0
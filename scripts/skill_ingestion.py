@@ -21,33 +21,49 @@ Review Flags Schema (IAW Issue #57):
     Use create_review_flag() helper to generate properly formatted flags.
 """
 
+import hashlib
 import json
 import yaml
 import re
 import os
 import sys
 import argparse
+import contextlib
+import io
+from itertools import repeat
 from pathlib import Path
 from datetime import datetime
 from collections import defaultdict
-from typing import Dict, List, Tuple, Any, Optional
+from typing import Callable, Dict, Iterator, List, NamedTuple, Tuple, Any, Optional
 
-# Add packages/ to path for imports
+# Add project root to path for packages/ imports
 operator_root = Path(__file__).parent.parent
-sys.path.insert(0, str(operator_root / "packages"))
+sys.path.insert(0, str(operator_root))
 
-from capture.deduplication import (
+from packages.capture.deduplication import (
     load_ingestion_history,
     save_ingestion_history,
+    index_processed_sessions,
     is_session_processed,
     mark_session_processed
 )
+from packages.common.cache import cache_path, prune_cache, read_cache, stat_key, write_cache
+from packages.common.parallel import file_size, pool_workers, process_pool
+from packages.common.serialization import YAML_DUMPER, YAML_LOADER, loads_json
 
 # Import session_tracker functions for history.jsonl parsing
 # Add scripts/ to path to import session_tracker
 sys.path.insert(0, str(operator_root / "scripts"))
 from session_tracker import parse_history_jsonl, convert_history_session_to_transcript
 
+# Bump when detection logic changes in a way the pattern tables don't capture
+DETECTION_CACHE_VERSION = 1
+
+# Transcript files are parsed in a process pool once a batch is this large
+PARALLEL_PARSE_MIN_BYTES = 1 << 20
+
+# Transcripts are scanned for skills in a process pool once their prompts total this many characters
+PARALLEL_DETECT_MIN_CHARS = 1 << 20
 
 # Strategic pattern detection - high-value orchestration work
 STRATEGIC_PATTERNS = {
@@ -507,6 +523,231 @@ NEGATIVE_PATTERNS = {
     ]
 }
 
+# Lowercase phrases for Level 0 readiness signals (IAW Issue #55)
+READINESS_PATTERNS = {
+    "avoidance": (
+        "don't want to learn", "avoid", "not interested in", "skip",
+        "don't use", "won't need"
+    ),
+    "interest": (
+        "want to learn", "interested in", "how do i", "can you teach",
+        "help me understand", "guide me through", "show me how"
+    ),
+    "conceptual": (
+        "understand", "concept", "theory", "aware that", "know that",
+        "familiar with", "heard of", "read about"
+    ),
+    "strong_foundation": (
+        "similar to", "like", "already know", "experience with",
+        "used before", "worked with", "proficient"
+    ),
+}
+
+
+def _compile_all(patterns: List[str], flags: int = re.IGNORECASE) -> List["re.Pattern"]:
+    """Compile a pattern list once at import; .pattern keeps the source for evidence."""
+    return [re.compile(pattern, flags) for pattern in patterns]
+
+
+_QUANTIFIERS = "?*+{"
+_REGEX_META = ".^$*+?{}[]|()\\"
+
+
+def _has_top_level_alternation(pattern: str) -> bool:
+    depth, i = 0, 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            i += 1
+        elif char == "[":
+            # Skip the character class; a leading ']' is literal inside it
+            i = pattern.find("]", i + 2 if pattern[i + 1:i + 2] == "]" else i + 1)
+            if i < 0:
+                return True
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            return True
+        i += 1
+    return False
+
+
+def _literal_prefix(pattern: str) -> Tuple[Optional[str], bool]:
+    """Lowercased literal text every match of pattern must start with.
+
+    Returns (prefix, exact): exact means the pattern is that literal and
+    nothing else. The prefix is None for non-ASCII patterns or when the
+    pattern has no mandatory leading literal (alternation, class, group).
+    """
+    if _has_top_level_alternation(pattern):
+        return None, False
+
+    i = 0
+    while pattern.startswith(("^", "\\b"), i):  # Zero-width, match nothing
+        i += 1 if pattern[i] == "^" else 2
+
+    prefix = []
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            char = pattern[i + 1:i + 2]
+            if not char or char.isalnum() or char == "_":
+                break  # Class escape (\d, \w, ...) or assertion (\b)
+            step = 2
+        elif char in _REGEX_META:
+            break
+        else:
+            step = 1
+        next_char = pattern[i + step:i + step + 1]
+        if next_char and next_char in _QUANTIFIERS:
+            if next_char == "+":
+                prefix.append(char)  # At least one copy, then stop
+            break
+        prefix.append(char)
+        i += step
+
+    text = "".join(prefix)
+    if not text or not text.isascii():
+        return None, False
+    return text.lower(), i == len(pattern)
+
+
+def _fold_case(pattern: str) -> Optional[str]:
+    """Lowercase the literal characters of an ASCII pattern, leaving escapes intact.
+
+    Searching the result case-sensitively in lowered ASCII text matches exactly
+    where pattern matches the original text under IGNORECASE. Returns None for
+    patterns where that does not hold obviously (non-ASCII, inline groups/flags,
+    named escapes, or uppercase letters inside a character class).
+    """
+    if not pattern.isascii() or "(?" in pattern or "\\N" in pattern:
+        return None
+    folded, i, in_class = [], 0, False
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            folded.append(pattern[i:i + 2])
+            i += 2
+            continue
+        if in_class and char.isupper():
+            return None  # e.g. [A-z] also spans punctuation
+        if char == "[":
+            in_class = True
+        elif char == "]":
+            in_class = False
+        folded.append(char.lower())
+        i += 1
+    return "".join(folded)
+
+
+class _ScanPattern(NamedTuple):
+    """A case-insensitive search pattern plus its fast paths for lowered ASCII content."""
+    regex: "re.Pattern"
+    prefix: Optional[str]  # Literal text every match starts with
+    exact: bool  # The pattern is just prefix
+    folded: Optional["re.Pattern"]  # Case-sensitive equivalent on lowered text
+
+
+def _compile_scan(patterns: List[str]) -> List[_ScanPattern]:
+    """Compile case-insensitive search patterns with their fast paths (see _found)."""
+    scans = []
+    for regex in _compile_all(patterns):
+        folded = _fold_case(regex.pattern)
+        scans.append(_ScanPattern(regex, *_literal_prefix(regex.pattern),
+                                  re.compile(folded) if folded is not None else None))
+    return scans
+
+
+def _found(scan: _ScanPattern, content: str, lowered: Optional[str]) -> bool:
+    """Search content for one _compile_scan pattern.
+
+    For ASCII text, lower() and IGNORECASE agree: a missing prefix rules the
+    pattern out, a present one settles pure literals, and the rest are searched
+    case-sensitively in the lowered text. Non-ASCII content (lowered is None)
+    always goes through the IGNORECASE regex.
+    """
+    if lowered is None:
+        return scan.regex.search(content) is not None
+    if scan.prefix is not None:
+        if scan.prefix not in lowered:
+            return False
+        if scan.exact:
+            return True
+    if scan.folded is not None:
+        return scan.folded.search(lowered) is not None
+    return scan.regex.search(content) is not None
+
+
+def _lowered(content: str) -> Optional[str]:
+    return content.lower() if content.isascii() else None
+
+
+# Compiled counterparts of the pattern tables above, in the same order
+_STRATEGIC_REGEXES = {
+    category: _compile_scan(config["patterns"]) for category, config in STRATEGIC_PATTERNS.items()
+}
+# Outcome patterns paired with their lowered literal prefix; finditer is
+# skipped when an ASCII interaction lacks the prefix
+_OUTCOME_REGEXES = {
+    outcome_type: [(regex, _literal_prefix(regex.pattern)[0]) for regex in _compile_all(config["patterns"])]
+    for outcome_type, config in OUTCOME_PATTERNS.items()
+}
+_LEVERAGE_REGEXES = {
+    leverage_type: _compile_scan(config["patterns"])
+    for leverage_type, config in AI_LEVERAGE_PATTERNS.items()
+}
+_ORCHESTRATION_REGEXES = {
+    skill_name: _compile_scan(config["user_patterns"])
+    for skill_name, config in ORCHESTRATION_PATTERNS.items()
+}
+_TECH_STACK_REGEXES = {
+    category: {skill_name: _compile_scan(patterns) for skill_name, patterns in skills.items()}
+    for category, skills in TECH_STACK_PATTERNS.items()
+}
+# Skepticism checks run on lowercased content, so no IGNORECASE
+_SKEPTICISM_REGEXES = {
+    flag: _compile_all(patterns, 0) for flag, patterns in SKEPTICISM_FLAGS.items()
+}
+# Learning cues are unanchored searches; each is tried only when its literal
+# prefix occurs (content is already lowercased, the patterns are lowercase)
+_LEARNING_SCREENS = [
+    (pattern, _literal_prefix(pattern.pattern)[0])
+    for pattern in _SKEPTICISM_REGEXES["learning_discussion"]
+]
+_NEGATIVE_REGEXES = {
+    skill_name: _compile_scan(patterns) for skill_name, patterns in NEGATIVE_PATTERNS.items()
+}
+
+# Flat (skill key, scans) rows for detect_tech_stack_skills, in table order
+_TECH_STACK_SKILLS = [
+    (f"tech_stack.{category}.{skill_name}", scans)
+    for category, skills in _TECH_STACK_REGEXES.items()
+    for skill_name, scans in skills.items()
+]
+
+# Per-skill scan rows for detect_orchestration_skills, in table order:
+# (skill, scans, negative scans, compound_required, tier, weight)
+_ORCHESTRATION_SKILLS = [
+    (skill_name, _ORCHESTRATION_REGEXES[skill_name], _NEGATIVE_REGEXES.get(skill_name, []),
+     config.get("compound_required", False), config.get("tier", 2), config.get("weight", 2.0))
+    for skill_name, config in ORCHESTRATION_PATTERNS.items()
+]
+
+# Cached detections are only valid for the tables they were computed with
+_PATTERN_TABLES_DIGEST = hashlib.blake2b(json.dumps([
+    DETECTION_CACHE_VERSION, STRATEGIC_PATTERNS, OUTCOME_PATTERNS, AI_LEVERAGE_PATTERNS,
+    ORCHESTRATION_PATTERNS, TECH_STACK_PATTERNS, SKEPTICISM_FLAGS, NEGATIVE_PATTERNS,
+]).encode(), digest_size=16).hexdigest()
+
+_PR_NUMBER_RE = re.compile(r'#(\d+)')
+_TEST_METRIC_RE = re.compile(
+    r'(\d+(?:\.\d+)?%?)\s+(?:passing|passed|tests?|accuracy|success|completion|coverage)',
+    re.IGNORECASE
+)
+_YYMMDD_RE = re.compile(r'(\d{6})')
+
 
 def create_review_flag(trigger: str, severity: str, message: str) -> Dict:
     """
@@ -555,12 +796,19 @@ def convert_cache_to_transcript(cache_file: Path) -> Optional[Dict]:
     timestamps = []
 
     try:
-        with open(cache_file, 'r') as f:
+        with open(cache_file, 'rb') as f:
             for line in f:
+                # Only user entries (and, until found, the session ID) matter;
+                # skip decoding the far more common assistant/tool lines.
+                # An unterminated last line is always decoded so a file that
+                # is still being written is rejected as before.
+                if b'"user"' not in line and (session_id or b'"assistant"' not in line) \
+                        and line.endswith(b'\n'):
+                    continue
                 if not line.strip():
                     continue
 
-                entry = json.loads(line)
+                entry = loads_json(line)
                 entry_type = entry.get("type")
 
                 # Extract session_id from user/assistant entries
@@ -612,6 +860,148 @@ def convert_cache_to_transcript(cache_file: Path) -> Optional[Dict]:
         return None
 
 
+def cached_cache_transcript(cache_file: Path) -> Optional[Dict]:
+    """
+    Return convert_cache_to_transcript(cache_file), memoized on disk.
+
+    Claude Code session files are append-only, so the (size, mtime) pair
+    identifies their contents; only sessions still being written are re-read.
+    """
+    key = stat_key(cache_file)
+    if key is None:
+        return None
+    memo_file = cache_path('cache_transcript', cache_file)
+
+    cached = read_cache(memo_file)
+    if cached and cached.get('key') == key and 'transcript' in cached:
+        return cached['transcript']
+
+    transcript_data = convert_cache_to_transcript(cache_file)
+    if transcript_data is not None:
+        write_cache(memo_file, {'source': str(cache_file), 'key': key, 'transcript': transcript_data})
+    return transcript_data
+
+
+def cached_detections(transcript: Dict) -> Tuple[Dict, Dict, Dict]:
+    """
+    Return (orchestration, tech_stack, outcomes) detections for a transcript.
+
+    Detections for file-backed transcripts are memoized on disk, one entry
+    per source path, keyed by the source_stat the file had when it was loaded
+    and by the pattern tables; a changed file overwrites its entry. Sessions
+    from history.jsonl, which every prompt appends to, are always scanned.
+    The returned structures are fresh copies that callers may annotate.
+    """
+    transcript_date = transcript.get("start_time", "")[:10]
+    interactions = transcript["interactions"]
+    source_stat = transcript.get("source_stat")
+    if source_stat is not None:
+        memo_file = cache_path('skill_detect', Path(transcript["path"]))
+        key = [source_stat, _PATTERN_TABLES_DIGEST]
+        cached = read_cache(memo_file)
+        if cached and cached.get('key') == key and 'outcomes' in cached:
+            return cached['orchestration'], cached['tech_stack'], cached['outcomes']
+
+    orchestration = detect_orchestration_skills(interactions)
+    tech_stack = detect_tech_stack_skills(interactions, transcript_date)
+    outcomes = detect_outcome_evidence(interactions)  # IAW Issue #40
+    if source_stat is not None:
+        write_cache(memo_file, {'source': transcript["path"], 'key': key, 'orchestration': orchestration,
+                                 'tech_stack': tech_stack, 'outcomes': outcomes})
+    return orchestration, tech_stack, outcomes
+
+
+def _content_chars(transcript: Dict) -> int:
+    return sum(len(interaction.get("content", "")) for interaction in transcript["interactions"])
+
+
+def _map_detections(transcripts: List[Dict]) -> Iterator[Tuple[Dict, Dict, Dict]]:
+    """
+    Yield cached_detections(transcript) for each transcript, in order.
+
+    Large batches are scanned in a process pool; the detection functions are
+    pure and print nothing, so results merge exactly as in the serial loop.
+    """
+    workers = pool_workers(len(transcripts), sum(map(_content_chars, transcripts)), PARALLEL_DETECT_MIN_CHARS)
+    if workers:
+        chunksize = max(1, len(transcripts) // (workers * 4))
+        with process_pool(workers) as executor:
+            yield from executor.map(cached_detections, transcripts, chunksize=chunksize)
+    else:
+        for transcript in transcripts:
+            yield cached_detections(transcript)
+
+
+def _load_legacy_transcript(json_file: Path) -> Optional[Dict]:
+    """Load one TerminalSavedOutput_*.json file as a parse_transcripts entry."""
+    # Taken before reading, so a concurrent write invalidates cached detections
+    source_stat = stat_key(json_file)
+    try:
+        with open(json_file, 'rb') as f:
+            data = loads_json(f.read())
+
+        # Validate session contract
+        if not all(key in data for key in ["session_id", "start_time", "interactions"]):
+            print(f"⚠️  {json_file.name} missing required fields - skipping")
+            return None
+
+        return {
+            "file": json_file.name,
+            "path": str(json_file),
+            "source_stat": source_stat,
+            "session_id": data.get("session_id", ""),
+            "start_time": data.get("start_time", ""),
+            "interactions": data.get("interactions", [])
+        }
+    except Exception as e:
+        print(f"⚠️  Error parsing {json_file.name}: {e}")
+        return None
+
+
+def _load_cache_transcript(cache_file: Path) -> Optional[Dict]:
+    """Load one cache .jsonl session as a parse_transcripts entry (None if empty)."""
+    # Taken before reading, so a concurrent write invalidates cached detections
+    source_stat = stat_key(cache_file)
+    transcript_data = cached_cache_transcript(cache_file)
+
+    if not (transcript_data and transcript_data.get("interactions")):
+        return None
+    return {
+        "file": cache_file.name,
+        "path": str(cache_file),
+        "source_stat": source_stat,
+        "session_id": transcript_data.get("session_id", ""),
+        "start_time": transcript_data.get("start_time", ""),
+        "interactions": transcript_data.get("interactions", [])
+    }
+
+
+def _load_captured(loader: Callable[[Path], Optional[Dict]], path: Path) -> Tuple[Optional[Dict], str]:
+    """Run a transcript loader in a worker process, returning its printed output too."""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        transcript = loader(path)
+    return transcript, output.getvalue()
+
+
+def _map_transcript_files(loader: Callable[[Path], Optional[Dict]], paths: List[Path]) -> Iterator[Optional[Dict]]:
+    """
+    Yield loader(path) for each path, in order.
+
+    Large batches are loaded in a process pool; worker messages are replayed
+    here in file order, so output matches the serial loop.
+    """
+    workers = pool_workers(len(paths), sum(map(file_size, paths)), PARALLEL_PARSE_MIN_BYTES)
+    if workers:
+        with process_pool(workers) as executor:
+            for transcript, output in executor.map(_load_captured, repeat(loader), paths, chunksize=8):
+                print(output, end="")
+                yield transcript
+    else:
+        for path in paths:
+            yield loader(path)
+
+
 def parse_transcripts(transcript_dir: Path, include_history: bool = True, include_cache: bool = True) -> List[Dict]:
     """
     Parse transcripts from multiple sources.
@@ -629,25 +1019,9 @@ def parse_transcripts(transcript_dir: Path, include_history: bool = True, includ
     # 1. Parse legacy TerminalSavedOutput_*.json files (EXISTING CODE)
     json_files = sorted(transcript_dir.glob("TerminalSavedOutput_*.json"))
 
-    for json_file in json_files:
-        try:
-            with open(json_file, 'r') as f:
-                data = json.load(f)
-
-            # Validate session contract
-            if not all(key in data for key in ["session_id", "start_time", "interactions"]):
-                print(f"⚠️  {json_file.name} missing required fields - skipping")
-                continue
-
-            transcripts.append({
-                "file": json_file.name,
-                "path": str(json_file),
-                "session_id": data.get("session_id", ""),
-                "start_time": data.get("start_time", ""),
-                "interactions": data.get("interactions", [])
-            })
-        except Exception as e:
-            print(f"⚠️  Error parsing {json_file.name}: {e}")
+    for transcript in _map_transcript_files(_load_legacy_transcript, json_files):
+        if transcript is not None:
+            transcripts.append(transcript)
 
     # 2. Parse history.jsonl sessions (NEW)
     if include_history:
@@ -670,20 +1044,15 @@ def parse_transcripts(transcript_dir: Path, include_history: bool = True, includ
     # 3. Parse cache .jsonl sessions (NEW)
     if include_cache:
         cache_dir = Path.home() / ".claude" / "projects"
-        if cache_dir.exists():
-            cache_files = sorted(cache_dir.rglob("*.jsonl"))
+        cache_files = sorted(cache_dir.rglob("*.jsonl")) if cache_dir.exists() else []
 
-            for cache_file in cache_files:
-                transcript_data = convert_cache_to_transcript(cache_file)
+        for transcript in _map_transcript_files(_load_cache_transcript, cache_files):
+            if transcript is not None:
+                transcripts.append(transcript)
 
-                if transcript_data and transcript_data.get("interactions"):
-                    transcripts.append({
-                        "file": cache_file.name,
-                        "path": str(cache_file),
-                        "session_id": transcript_data.get("session_id", ""),
-                        "start_time": transcript_data.get("start_time", ""),
-                        "interactions": transcript_data.get("interactions", [])
-                    })
+        # Every file-backed source is listed by now, so other cached entries are stale
+        prune_cache('cache_transcript', cache_files)
+        prune_cache('skill_detect', json_files + cache_files)
 
     return transcripts
 
@@ -692,16 +1061,16 @@ def analyze_skepticism(user_content: str) -> Tuple[bool, str]:
     """Analyze if user message shows passive observation or active engagement."""
     content_lower = user_content.lower().strip()
 
-    for pattern in SKEPTICISM_FLAGS["passive_observation"]:
-        if re.match(pattern, content_lower):
+    for pattern in _SKEPTICISM_REGEXES["passive_observation"]:
+        if pattern.match(content_lower):
             return True, "passive_observation"
 
-    for pattern in SKEPTICISM_FLAGS["blind_acceptance"]:
-        if re.match(pattern, content_lower):
+    for pattern in _SKEPTICISM_REGEXES["blind_acceptance"]:
+        if pattern.match(content_lower):
             return True, "blind_acceptance"
 
-    for pattern in SKEPTICISM_FLAGS["learning_discussion"]:
-        if re.search(pattern, content_lower):
+    for pattern, prefix in _LEARNING_SCREENS:
+        if (prefix is None or prefix in content_lower) and pattern.search(content_lower):
             return True, "learning_discussion"
 
     return False, "active_demonstration"
@@ -709,34 +1078,42 @@ def analyze_skepticism(user_content: str) -> Tuple[bool, str]:
 
 def detect_leverage_context(content: str) -> Dict[str, int]:
     """Analyze AI leverage context - how operator engages with AI."""
+    lowered = _lowered(content)
+
+    # Check strategic patterns
+    strategic_patterns = 0
+    for category, patterns in _STRATEGIC_REGEXES.items():
+        for scan in patterns:
+            if _found(scan, content, lowered):
+                strategic_patterns += 1
+                break  # Count once per category
+
+    return _leverage_context(strategic_patterns, content, lowered)
+
+
+def _leverage_context(strategic_patterns: int, content: str, lowered: Optional[str]) -> Dict[str, int]:
+    """detect_leverage_context given the number of strategic categories that matched."""
     leverage = {
-        "strategic_patterns": 0,
+        "strategic_patterns": strategic_patterns,
         "directive_instances": 0,
         "evaluative_instances": 0,
         "iterative_instances": 0,
         "learning_instances": 0
     }
 
-    # Check strategic patterns
-    for category, config in STRATEGIC_PATTERNS.items():
-        for pattern in config["patterns"]:
-            if re.search(pattern, content, re.IGNORECASE):
-                leverage["strategic_patterns"] += 1
-                break  # Count once per category
-
     # Check leverage patterns
-    for leverage_type, config in AI_LEVERAGE_PATTERNS.items():
-        for pattern in config["patterns"]:
-            if re.search(pattern, content, re.IGNORECASE):
+    for leverage_type, patterns in _LEVERAGE_REGEXES.items():
+        for scan in patterns:
+            if _found(scan, content, lowered):
                 leverage[f"{leverage_type}_instances"] += 1
                 break  # Count once per type
 
     return leverage
 
 
-def detect_orchestration_skills(interactions: List[Dict]) -> Dict[str, Dict]:
-    """Detect orchestration skills from transcript interactions with strategic pattern emphasis."""
-    skill_detections = defaultdict(lambda: {
+def _new_detection() -> Dict:
+    """Empty per-skill accumulator for detect_orchestration_skills (plain dicts, YAML-safe)."""
+    return {
         "count": 0,
         "evidence": [],
         "quality": [],
@@ -747,103 +1124,111 @@ def detect_orchestration_skills(interactions: List[Dict]) -> Dict[str, Dict]:
             "iterative_instances": 0,
             "learning_instances": 0
         },
-        "detection_breakdown": defaultdict(int)
-    })
+        "detection_breakdown": {}
+    }
+
+
+def detect_orchestration_skills(interactions: List[Dict]) -> Dict[str, Dict]:
+    """Detect orchestration skills from transcript interactions with strategic pattern emphasis."""
+    # Entries are created only for skills that match (see _new_detection)
+    skill_detections = {}
 
     for interaction in interactions:
         if interaction.get("type") != "user_prompt":
             continue
 
         content = interaction.get("content", "")
-        is_passive, quality = analyze_skepticism(content)
-        leverage = detect_leverage_context(content)
+        lowered = _lowered(content)
 
         # Detect strategic patterns first
-        for category, config in STRATEGIC_PATTERNS.items():
-            matches = 0
-            matched_patterns = []
-
-            for pattern in config["patterns"]:
-                if re.search(pattern, content, re.IGNORECASE):
-                    matches += 1
-                    matched_patterns.append(pattern)
-
-            if matches > 0:
-                skill_detections[category]["count"] += matches
-                skill_detections[category]["detection_breakdown"][category] += matches
-
-                # Add leverage context
-                for key in leverage:
-                    skill_detections[category]["leverage_context"][key] += leverage[key]
-
-                skill_detections[category]["evidence"].append({
-                    "content": content[:200],
-                    "interaction_id": interaction.get("id", ""),
-                    "patterns": matched_patterns,
-                    "quality": quality,
-                    "category": category
-                })
-                skill_detections[category]["quality"].append(quality)
-
-        # Detect orchestration patterns with compound requirements and filtering
-        for skill_name, skill_config in ORCHESTRATION_PATTERNS.items():
-            matches = 0
-            matched_patterns = []
-
-            # Skip if content too short (minimum 50 chars for context)
-            if len(content.strip()) < 50:
+        strategic_hits = []
+        for category, patterns in _STRATEGIC_REGEXES.items():
+            matched_patterns = [scan.regex.pattern for scan in patterns if _found(scan, content, lowered)]
+            if matched_patterns:
+                strategic_hits.append((category, matched_patterns))
+
+        # Detect orchestration patterns with compound requirements and filtering,
+        # skipping content too short for context (minimum 50 chars once stripped)
+        orchestration_hits = []
+        if len(content) < 50 or len(content.strip()) < 50:
+            orchestration_skills = ()
+        else:
+            orchestration_skills = _ORCHESTRATION_SKILLS
+        for skill_name, scans, negative_scans, compound_required, tier, weight in orchestration_skills:
+            matched_patterns = [scan.regex.pattern for scan in scans if _found(scan, content, lowered)]
+            if not matched_patterns:
                 continue
 
-            # Check negative patterns first - skip if false positive detected
-            if skill_name in NEGATIVE_PATTERNS:
-                is_false_positive = False
-                for neg_pattern in NEGATIVE_PATTERNS[skill_name]:
-                    if re.search(neg_pattern, content, re.IGNORECASE):
-                        is_false_positive = True
-                        break
-                if is_false_positive:
-                    continue
-
-            for pattern in skill_config["user_patterns"]:
-                if re.search(pattern, content, re.IGNORECASE):
-                    matches += 1
-                    matched_patterns.append(pattern)
-
             # Apply compound pattern requirement for Tier 3 skills
-            compound_required = skill_config.get("compound_required", False)
-            if compound_required and matches < 2:
+            if compound_required and len(matched_patterns) < 2:
                 # Skip detection - need at least 2 patterns for low-tier skills
                 continue
 
-            if matches > 0:
-                skill_detections[skill_name]["count"] += matches
-
-                # Add leverage context
-                for key in leverage:
-                    skill_detections[skill_name]["leverage_context"][key] += leverage[key]
-
-                skill_detections[skill_name]["evidence"].append({
-                    "content": content[:200],
-                    "interaction_id": interaction.get("id", ""),
-                    "patterns": matched_patterns,
-                    "quality": quality,
-                    "tier": skill_config.get("tier", 2),  # Track pattern tier
-                    "weight": skill_config.get("weight", 2.0)
-                })
-                skill_detections[skill_name]["quality"].append(quality)
-
-    # Convert defaultdicts to regular dicts for YAML serialization
-    result = {}
-    for skill_name, data in skill_detections.items():
-        result[skill_name] = {
-            "count": data["count"],
-            "evidence": data["evidence"],
-            "quality": data["quality"],
-            "leverage_context": dict(data["leverage_context"]),
-            "detection_breakdown": dict(data["detection_breakdown"]) if data["detection_breakdown"] else {}
-        }
+            # Negative patterns veto a detection as a false positive; they are
+            # only consulted once the skill's own patterns have matched
+            is_false_positive = False
+            for neg_scan in negative_scans:
+                if _found(neg_scan, content, lowered):
+                    is_false_positive = True
+                    break
+            if is_false_positive:
+                continue
+
+            orchestration_hits.append((skill_name, matched_patterns, tier, weight))
+
+        if not strategic_hits and not orchestration_hits:
+            continue
+
+        # Skepticism and leverage only annotate detections; the strategic
+        # category count is the leverage context's strategic_patterns
+        is_passive, quality = analyze_skepticism(content)
+        leverage = _leverage_context(len(strategic_hits), content, lowered)
+        # One snippet object shared by every evidence entry for this interaction
+        snippet = content[:200]
+
+        for category, matched_patterns in strategic_hits:
+            matches = len(matched_patterns)
+            detection = skill_detections.get(category)
+            if detection is None:
+                detection = skill_detections[category] = _new_detection()
+            detection["count"] += matches
+            breakdown = detection["detection_breakdown"]
+            breakdown[category] = breakdown.get(category, 0) + matches
+
+            # Add leverage context
+            for key in leverage:
+                detection["leverage_context"][key] += leverage[key]
+
+            detection["evidence"].append({
+                "content": snippet,
+                "interaction_id": interaction.get("id", ""),
+                "patterns": matched_patterns,
+                "quality": quality,
+                "category": category
+            })
+            detection["quality"].append(quality)
+
+        for skill_name, matched_patterns, tier, weight in orchestration_hits:
+            detection = skill_detections.get(skill_name)
+            if detection is None:
+                detection = skill_detections[skill_name] = _new_detection()
+            detection["count"] += len(matched_patterns)
+
+            # Add leverage context
+            for key in leverage:
+                detection["leverage_context"][key] += leverage[key]
+
+            detection["evidence"].append({
+                "content": snippet,
+                "interaction_id": interaction.get("id", ""),
+                "patterns": matched_patterns,
+                "quality": quality,
+                "tier": tier,  # Track pattern tier
+                "weight": weight
+            })
+            detection["quality"].append(quality)
 
-    return result
+    return skill_detections
 
 
 def detect_tech_stack_skills(interactions: List[Dict], transcript_date: str = "") -> Dict[str, Dict]:
@@ -856,20 +1241,22 @@ def detect_tech_stack_skills(interactions: List[Dict], transcript_date: str = ""
 
     for interaction in interactions:
         content = interaction.get("content", "")
-
-        for category, skills in TECH_STACK_PATTERNS.items():
-            for skill_name, patterns in skills.items():
-                for pattern in patterns:
-                    if re.search(pattern, content, re.IGNORECASE):
-                        skill_key = f"tech_stack.{category}.{skill_name}"
-                        skill_detections[skill_key]["count"] += 1
-                        skill_detections[skill_key]["evidence"].append({
-                            "content": content[:200],
-                            "interaction_id": interaction.get("id", "")
-                        })
-                        if transcript_date and transcript_date not in skill_detections[skill_key]["sessions"]:
-                            skill_detections[skill_key]["sessions"].append(transcript_date)
-                        break
+        lowered = _lowered(content)
+        snippet = None  # Shared by this interaction's evidence entries
+
+        for skill_key, patterns in _TECH_STACK_SKILLS:
+            for scan in patterns:
+                if _found(scan, content, lowered):
+                    if snippet is None:
+                        snippet = content[:200]
+                    skill_detections[skill_key]["count"] += 1
+                    skill_detections[skill_key]["evidence"].append({
+                        "content": snippet,
+                        "interaction_id": interaction.get("id", "")
+                    })
+                    if transcript_date and transcript_date not in skill_detections[skill_key]["sessions"]:
+                        skill_detections[skill_key]["sessions"].append(transcript_date)
+                    break
 
     return dict(skill_detections)
 
@@ -945,10 +1332,14 @@ def detect_outcome_evidence(interactions: List[Dict]) -> Dict[str, List[Dict]]:
         except Exception:
             date = ""
 
+        lowered = _lowered(content)
+
         # Check each outcome type
-        for outcome_type, config in OUTCOME_PATTERNS.items():
-            for pattern in config["patterns"]:
-                matches = re.finditer(pattern, content, re.IGNORECASE)
+        for outcome_type, patterns in _OUTCOME_REGEXES.items():
+            for pattern, prefix in patterns:
+                if lowered is not None and prefix is not None and prefix not in lowered:
+                    continue
+                matches = pattern.finditer(content)
                 for match in matches:
                     # Extract matched text for context
                     matched_text = match.group(0)
@@ -959,14 +1350,14 @@ def detect_outcome_evidence(interactions: List[Dict]) -> Dict[str, List[Dict]]:
                             reference = f"github:{matched_text}"
                         elif "#" in matched_text:
                             # Extract just the number
-                            pr_num = re.search(r'#(\d+)', matched_text)
+                            pr_num = _PR_NUMBER_RE.search(matched_text)
                             reference = f"github:pr/{pr_num.group(1)}" if pr_num else f"github:{matched_text}"
                         else:
                             reference = f"github:{matched_text}"
                     # For test results, extract metrics
                     elif outcome_type == "tests_passed":
                         # Try to extract the number or percentage
-                        metric_match = re.search(r'(\d+(?:\.\d+)?%?)\s+(?:passing|passed|tests?|accuracy|success|completion|coverage)', matched_text, re.IGNORECASE)
+                        metric_match = _TEST_METRIC_RE.search(matched_text)
                         if metric_match:
                             reference = f"metric:{metric_match.group(1)}"
                         else:
@@ -1042,26 +1433,10 @@ def detect_readiness_signals(interactions: List[Dict], skill_name: str) -> Tuple
     combined_content = " ".join(user_content)
     skill_lower = skill_name.lower()
 
-    # Pattern detection
-    avoidance_patterns = [
-        "don't want to learn", "avoid", "not interested in", "skip",
-        "don't use", "won't need"
-    ]
-
-    interest_patterns = [
-        "want to learn", "interested in", "how do i", "can you teach",
-        "help me understand", "guide me through", "show me how"
-    ]
-
-    conceptual_patterns = [
-        "understand", "concept", "theory", "aware that", "know that",
-        "familiar with", "heard of", "read about"
-    ]
-
-    strong_foundation_patterns = [
-        "similar to", "like", "already know", "experience with",
-        "used before", "worked with", "proficient"
-    ]
+    avoidance_patterns = READINESS_PATTERNS["avoidance"]
+    interest_patterns = READINESS_PATTERNS["interest"]
+    conceptual_patterns = READINESS_PATTERNS["conceptual"]
+    strong_foundation_patterns = READINESS_PATTERNS["strong_foundation"]
 
     # Check for explicit avoidance
     for pattern in avoidance_patterns:
@@ -1087,16 +1462,9 @@ def detect_readiness_signals(interactions: List[Dict], skill_name: str) -> Tuple
     return "not_ready", "Insufficient evidence of conceptual foundation or interest"
 
 
-def analyze_temporal_metadata(skill_name: str, all_transcripts: List[Dict], skill_detections: Dict) -> Dict:
-    """Generate temporal metadata for a skill."""
-    sessions_with_skill = []
-
-    for transcript in all_transcripts:
-        transcript_date = transcript.get("start_time", "")[:10]
-
-        detections = detect_orchestration_skills(transcript["interactions"])
-        if skill_name in detections:
-            sessions_with_skill.append(transcript_date)
+def analyze_temporal_metadata(skill_name: str, skill_data: Dict) -> Dict:
+    """Generate temporal metadata for a skill from its per-transcript session dates."""
+    sessions_with_skill = skill_data.get("session_dates", [])
 
     if not sessions_with_skill:
         return {}
@@ -1146,9 +1514,9 @@ def load_existing_skills(skills_path: Path) -> Dict:
     if active_path.exists() and history_path.exists():
         print(f"   Loading from split structure (active + history)")
         with open(active_path, 'r') as f:
-            active_data = yaml.safe_load(f)
+            active_data = yaml.load(f, Loader=YAML_LOADER)
         with open(history_path, 'r') as f:
-            history_data = yaml.safe_load(f)
+            history_data = yaml.load(f, Loader=YAML_LOADER)
 
         # Merge the two structures
         merged = {"skills": merge_skill_structures(
@@ -1161,7 +1529,7 @@ def load_existing_skills(skills_path: Path) -> Dict:
     elif legacy_path.exists():
         print(f"   Loading from legacy skills.yaml (consider running split script)")
         with open(legacy_path, 'r') as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=YAML_LOADER)
 
     else:
         raise FileNotFoundError(
@@ -1184,10 +1552,8 @@ def merge_skill_structures(active: Dict, historical: Dict) -> Dict:
     """
     merged = {}
 
-    # Merge all keys from both structures
-    all_keys = set(active.keys()) | set(historical.keys())
-
-    for key in all_keys:
+    # Merge all keys from both structures, active keys first
+    for key in {**active, **historical}:
         active_value = active.get(key, {})
         historical_value = historical.get(key, {})
 
@@ -1195,8 +1561,7 @@ def merge_skill_structures(active: Dict, historical: Dict) -> Dict:
         if isinstance(active_value, dict) and isinstance(historical_value, dict):
             # Recursively merge nested structures
             merged[key] = {}
-            nested_keys = set(active_value.keys()) | set(historical_value.keys())
-            for nested_key in nested_keys:
+            for nested_key in {**active_value, **historical_value}:
                 active_nested = active_value.get(nested_key, [])
                 historical_nested = historical_value.get(nested_key, [])
 
@@ -1250,7 +1615,7 @@ def generate_temporal_metadata_for_tech_stack(skill_name: str, skill_data: Dict)
     }
 
 
-def build_evidence_sessions(evidence_samples: List[Dict], data_dir: Path, all_transcripts: List[Dict]) -> List[Dict]:
+def build_evidence_sessions(evidence_samples: List[Dict], data_dir: Path, transcript_map: Dict[str, Dict]) -> List[Dict]:
     """
     Build evidence_sessions from evidence samples.
     IAW Issue #71: Convert evidence array to evidence_sessions format.
@@ -1258,16 +1623,13 @@ def build_evidence_sessions(evidence_samples: List[Dict], data_dir: Path, all_tr
     Args:
         evidence_samples: List of evidence dicts with source_file, interaction_id, content
         data_dir: Base directory for transcript files (from OPERATOR_DATA_DIR)
-        all_transcripts: List of all parsed transcripts with session_id and start_time
+        transcript_map: Parsed transcripts (with session_id and start_time) keyed by file name
 
     Returns:
         List of evidence_session dicts with session_file, session_id, date, interaction_id, snippet
     """
     evidence_sessions = []
 
-    # Create lookup map from filename to transcript data
-    transcript_map = {t.get("file", ""): t for t in all_transcripts}
-
     for evidence in evidence_samples:
         source_file = evidence.get("source_file", "")
         interaction_id = evidence.get("interaction_id", "")
@@ -1295,7 +1657,7 @@ def build_evidence_sessions(evidence_samples: List[Dict], data_dir: Path, all_tr
                     date = start_time[:10]  # Assume YYYY-MM-DD
         else:
             # Fallback: try to extract date from legacy filename format
-            date_match = re.search(r'(\d{6})', session_file)
+            date_match = _YYMMDD_RE.search(session_file)
             if date_match:
                 # Convert YYMMDD to YYYY-MM-DD
                 date_str = date_match.group(1)
@@ -1347,8 +1709,18 @@ def generate_report(all_detections: Dict, all_transcripts: List[Dict], existing_
         "suggested_updates": []
     }
 
+    # Lookup map from filename to transcript data, shared by every evidence_sessions build
+    transcript_map = {t.get("file", ""): t for t in all_transcripts}
+    data_dir = Path(os.getenv('OPERATOR_DATA_DIR', '')).expanduser() if os.getenv('OPERATOR_DATA_DIR') else Path('')
+
     for skill_name, skill_data in all_detections.items():
-        session_count = len(set(e.get("source_file", "") for e in skill_data.get("evidence", [])))
+        session_count = len(skill_data["source_files"])
+
+        # calculate_confidence caps the base score at 40 and never adds to it
+        # otherwise, so skip skills whose bonuses cannot lift them to 70
+        if 40 + min(session_count * 5, 30) + min(len(skill_data.get("evidence", [])) * 3, 30) < 70:
+            continue
+
         confidence = calculate_confidence(skill_data, session_count)
 
         if confidence < 70:
@@ -1358,7 +1730,7 @@ def generate_report(all_detections: Dict, all_transcripts: List[Dict], existing_
         if skill_name.startswith("tech_stack."):
             temporal_metadata = generate_temporal_metadata_for_tech_stack(skill_name, skill_data)
         else:
-            temporal_metadata = analyze_temporal_metadata(skill_name, all_transcripts, all_detections)
+            temporal_metadata = analyze_temporal_metadata(skill_name, skill_data)
 
         # Recommend validation type based on outcome evidence (IAW Issue #56)
         outcome_evidence = skill_data.get("outcome_evidence", {})
@@ -1376,8 +1748,7 @@ def generate_report(all_detections: Dict, all_transcripts: List[Dict], existing_
 
         # Build evidence_sessions from evidence samples (IAW Issue #71)
         evidence_samples = skill_data.get("evidence", [])[:3]  # Top 3 evidence samples
-        data_dir = Path(os.getenv('OPERATOR_DATA_DIR', '')).expanduser() if os.getenv('OPERATOR_DATA_DIR') else Path('')
-        evidence_sessions = build_evidence_sessions(evidence_samples, data_dir, all_transcripts)
+        evidence_sessions = build_evidence_sessions(evidence_samples, data_dir, transcript_map)
 
         suggestion = {
             "skill_name": skill_name,
@@ -1483,6 +1854,7 @@ def main():
     # Load deduplication history
     history_file = ledger_dir / "_meta" / "ingestion_history.yaml"
     ingestion_history = load_ingestion_history(history_file)
+    processed_ids = index_processed_sessions(ingestion_history)
 
     # Parse transcripts based on source selection
     print(f"📂 Parsing transcripts from source: {args.source}...")
@@ -1501,7 +1873,7 @@ def main():
 
         if args.force_reprocess or not args.skip_processed:
             transcripts.append(t)
-        elif not is_session_processed(ingestion_history, session_id):
+        elif not is_session_processed(ingestion_history, session_id, processed_ids):
             transcripts.append(t)
         else:
             skipped_count += 1
@@ -1525,7 +1897,9 @@ def main():
             "learning_instances": 0
         },
         "detection_breakdown": {},
-        "sessions": [],
+        "sessions": set(),  # Distinct tech_stack session dates
+        "session_dates": [],  # One start date per transcript with the skill, for temporal metadata
+        "source_files": set(),  # Transcripts that contributed evidence, for the session count
         "outcome_evidence": []  # IAW Issue #40
     })
 
@@ -1533,28 +1907,31 @@ def main():
     orchestration_skill_count = 0
     tech_stack_skill_count = 0
 
-    for transcript in transcripts:
-        transcript_date = transcript.get("start_time", "")[:10]  # Extract YYYY-MM-DD
-
-        orchestration = detect_orchestration_skills(transcript["interactions"])
-        tech_stack = detect_tech_stack_skills(transcript["interactions"], transcript_date)
-        outcomes = detect_outcome_evidence(transcript["interactions"])  # IAW Issue #40
+    for transcript, (orchestration, tech_stack, outcomes) in zip(transcripts, _map_detections(transcripts)):
+        transcript_date = transcript.get("start_time", "")[:10]
 
         for skill_name, skill_data in orchestration.items():
-            all_detections[skill_name]["count"] += skill_data.get("count", 0)
-            for evidence in skill_data.get("evidence", []):
+            merged = all_detections[skill_name]
+            merged["count"] += skill_data.get("count", 0)
+            merged["session_dates"].append(transcript_date)
+            evidence_list = skill_data.get("evidence", [])
+            for evidence in evidence_list:
                 evidence["source_file"] = transcript["file"]
-                all_detections[skill_name]["evidence"].append(evidence)
-            all_detections[skill_name]["quality"].extend(skill_data.get("quality", []))
+                merged["evidence"].append(evidence)
+            if evidence_list:
+                merged["source_files"].add(transcript["file"])
+            merged["quality"].extend(skill_data.get("quality", []))
 
             # Merge leverage context
-            for key in all_detections[skill_name]["leverage_context"]:
-                all_detections[skill_name]["leverage_context"][key] += skill_data.get("leverage_context", {}).get(key, 0)
+            leverage = merged["leverage_context"]
+            transcript_leverage = skill_data.get("leverage_context", {})
+            for key in leverage:
+                leverage[key] += transcript_leverage.get(key, 0)
 
             # Merge detection breakdown
+            breakdown = merged["detection_breakdown"]
             for breakdown_key, value in skill_data.get("detection_breakdown", {}).items():
-                all_detections[skill_name]["detection_breakdown"][breakdown_key] = \
-                    all_detections[skill_name]["detection_breakdown"].get(breakdown_key, 0) + value
+                breakdown[breakdown_key] = breakdown.get(breakdown_key, 0) + value
 
             # Track skill type
             if skill_name in STRATEGIC_PATTERNS:
@@ -1563,15 +1940,17 @@ def main():
                 orchestration_skill_count += 1
 
         for skill_name, skill_data in tech_stack.items():
-            all_detections[skill_name]["count"] += skill_data.get("count", 0)
-            for evidence in skill_data.get("evidence", []):
+            merged = all_detections[skill_name]
+            merged["count"] += skill_data.get("count", 0)
+            evidence_list = skill_data.get("evidence", [])
+            for evidence in evidence_list:
                 evidence["source_file"] = transcript["file"]
-                all_detections[skill_name]["evidence"].append(evidence)
+                merged["evidence"].append(evidence)
+            if evidence_list:
+                merged["source_files"].add(transcript["file"])
 
             # Merge sessions for temporal metadata
-            for session in skill_data.get("sessions", []):
-                if session not in all_detections[skill_name]["sessions"]:
-                    all_detections[skill_name]["sessions"].append(session)
+            merged["sessions"].update(skill_data.get("sessions", []))
 
             tech_stack_skill_count += 1
 
@@ -1585,16 +1964,25 @@ def main():
     # Add outcome statistics to report metadata
     total_outcomes = sum(len(all_detections[skill].get("outcome_evidence", [])) for skill in all_detections)
 
+    strategic_total = orchestration_total = tech_stack_total = 0
+    for skill_name in all_detections:
+        if skill_name in STRATEGIC_PATTERNS:
+            strategic_total += 1
+        elif skill_name.startswith('tech_stack.'):
+            tech_stack_total += 1
+        else:
+            orchestration_total += 1
+
     print(f"✅ Detected {len(all_detections)} total skills")
-    print(f"   Strategic patterns: {len([k for k in all_detections.keys() if k in STRATEGIC_PATTERNS])} skills")
-    print(f"   Orchestration patterns: {len([k for k in all_detections.keys() if k not in STRATEGIC_PATTERNS and not k.startswith('tech_stack.')])} skills")
-    print(f"   Tech stack patterns: {len([k for k in all_detections.keys() if k.startswith('tech_stack.')])} skills")
+    print(f"   Strategic patterns: {strategic_total} skills")
+    print(f"   Orchestration patterns: {orchestration_total} skills")
+    print(f"   Tech stack patterns: {tech_stack_total} skills")
 
     print(f"📊 Generating report...")
     report = generate_report(dict(all_detections), transcripts, existing_skills)
 
     with open(args.output, 'w') as f:
-        yaml.dump(report, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(report, f, Dumper=YAML_DUMPER, default_flow_style=False, sort_keys=False)
 
     print(f"✅ Report generated: {args.output}")
     print(f"   Suggested updates: {len(report['suggested_updates'])}")
@@ -1630,7 +2018,8 @@ def main():
                 session_id,
                 source="skill-analysis",
                 source_path=transcript.get("path", ""),
-                timestamp=transcript.get("start_time", "")
+                timestamp=transcript.get("start_time", ""),
+                processed_ids=processed_ids
             )
 
     # Save updated deduplication history
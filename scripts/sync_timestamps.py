@@ -31,6 +31,10 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Set
 from collections import defaultdict
 
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from packages.common.serialization import YAML_DUMPER, YAML_LOADER
+
 # Paths
 LEDGER_ROOT = Path(__file__).resolve().parents[1] / "packages" / "ledger"
 PROJECTS_FILE = LEDGER_ROOT / "projects.yaml"
@@ -41,6 +45,9 @@ SESSIONS_FILE = LEDGER_ROOT / "sessions.yaml"
 # Tolerance window
 DRIFT_TOLERANCE_DAYS = 7
 
+# Shared keywords that relate a project to a skill
+SEMANTIC_KEYWORDS = ["json", "python", "rust", "yaml", "cli", "api", "web", "tauri"]
+
 # Dry run mode
 DRY_RUN = "--dry-run" in sys.argv
 
@@ -51,13 +58,25 @@ def load_yaml_file(path: Path) -> dict:
         return {}
 
     with open(path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+        return yaml.load(f, Loader=YAML_LOADER) or {}
 
 
 def save_yaml_file(path: Path, data: dict):
     """Save YAML file with proper formatting."""
     with open(path, "w", encoding="utf-8") as f:
-        yaml.dump(data, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+        yaml.dump(data, f, Dumper=YAML_DUMPER, default_flow_style=False, sort_keys=False, allow_unicode=True)
+
+
+def _keyword_mask(name_lower: str) -> int:
+    """Bit i is set when SEMANTIC_KEYWORDS[i] occurs in the lowercased name."""
+    return sum(1 << i for i, keyword in enumerate(SEMANTIC_KEYWORDS) if keyword in name_lower)
+
+
+def _related(project_lower: str, project_mask: int, skill_lower: str, skill_mask: int) -> bool:
+    """find_semantic_matches on lowercased names and their _keyword_mask values."""
+    # Direct substring match, or a shared keyword
+    return (skill_lower in project_lower or project_lower in skill_lower
+            or bool(project_mask & skill_mask))
 
 
 def find_semantic_matches(project_name: str, skill_name: str) -> bool:
@@ -71,18 +90,7 @@ def find_semantic_matches(project_name: str, skill_name: str) -> bool:
     """
     project_lower = project_name.lower()
     skill_lower = skill_name.lower()
-
-    # Direct substring match
-    if skill_lower in project_lower or project_lower in skill_lower:
-        return True
-
-    # Check for common keywords
-    keywords = ["json", "python", "rust", "yaml", "cli", "api", "web", "tauri"]
-    for keyword in keywords:
-        if keyword in project_lower and keyword in skill_lower:
-            return True
-
-    return False
+    return _related(project_lower, _keyword_mask(project_lower), skill_lower, _keyword_mask(skill_lower))
 
 
 def extract_project_info(projects_data: dict) -> List[Dict]:
@@ -154,25 +162,43 @@ def extract_skill_info(skills_data: dict) -> List[Dict]:
     return skills
 
 
+def _parse_timestamp(timestamp) -> datetime | None:
+    try:
+        return datetime.fromisoformat(str(timestamp))
+    except Exception:
+        return None
+
+
 def find_timestamp_drifts(projects: List[Dict], skills: List[Dict]) -> List[Tuple]:
     """
     Find semantically related project-skill pairs with timestamp drift >7 days.
 
+    Same pairs as calling find_semantic_matches on every project/skill pair,
+    but names are lowercased, keyword masks computed and timestamps parsed
+    once per entity.
+
     Returns: List of (project_info, skill_info, drift_days, canonical_timestamp) tuples
     """
     drifts = []
+    if not projects or not skills:
+        return drifts
+
+    skill_names = [skill["name"].lower() for skill in skills]
+    skill_masks = [_keyword_mask(skill_lower) for skill_lower in skill_names]
+    skill_times = [_parse_timestamp(skill["timestamp"]) for skill in skills]
 
     for project in projects:
-        for skill in skills:
+        project_lower = project["name"].lower()
+        project_mask = _keyword_mask(project_lower)
+        project_dt = _parse_timestamp(project["timestamp"])
+
+        for index, skill_lower in enumerate(skill_names):
             # Check if semantically related
-            if not find_semantic_matches(project["name"], skill["name"]):
+            if not _related(project_lower, project_mask, skill_lower, skill_masks[index]):
                 continue
 
-            # Parse timestamps
-            try:
-                project_dt = datetime.fromisoformat(str(project["timestamp"]))
-                skill_dt = datetime.fromisoformat(str(skill["timestamp"]))
-            except Exception:
+            skill_dt = skill_times[index]
+            if project_dt is None or skill_dt is None:
                 continue
 
             # Calculate drift
@@ -181,7 +207,7 @@ def find_timestamp_drifts(projects: List[Dict], skills: List[Dict]) -> List[Tupl
             if drift_days > DRIFT_TOLERANCE_DAYS:
                 # Use most recent as canonical
                 canonical = max(project_dt, skill_dt).date().isoformat()
-                drifts.append((project, skill, drift_days, canonical))
+                drifts.append((project, skills[index], drift_days, canonical))
 
     return drifts
 
@@ -290,14 +316,16 @@ def main():
 
     total_entities = len(project_changes) + len(skill_changes)
 
-    # Write changes
+    # Write changes, skipping files whose timestamps already held the canonical value
     if not DRY_RUN:
         print(f"Writing changes to disk...")
-        save_yaml_file(PROJECTS_FILE, projects_data)
-        print(f"  ✓ Updated {PROJECTS_FILE.name}")
-
-        save_yaml_file(skills_file, skills_data)
-        print(f"  ✓ Updated {skills_file.name}")
+        for path, data, changes in ((PROJECTS_FILE, projects_data, project_changes),
+                                    (skills_file, skills_data, skill_changes)):
+            if any(old != new for _, old, new, _ in changes):
+                save_yaml_file(path, data)
+                print(f"  ✓ Updated {path.name}")
+            else:
+                print(f"  ✓ {path.name} already in sync, not rewritten")
 
         print(f"\n✓ Synchronized {len(drifts)} relationship(s), updated {total_entities} entities")
     else:
@@ -14,6 +14,10 @@ from pathlib import Path
 
 import yaml
 
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from packages.common.serialization import YAML_DUMPER, YAML_LOADER
+
 
 STALE_THRESHOLD_DAYS = 90
 
@@ -42,7 +46,7 @@ def update_decision_recency(decisions_path=None):
         return {"total": 0, "active": 0, "stale": 0, "archived": 0}
 
     with open(decisions_path) as f:
-        data = yaml.safe_load(f) or {}
+        data = yaml.load(f, Loader=YAML_LOADER) or {}
 
     decisions = data.get("decisions", [])
     if not decisions:
@@ -59,9 +63,11 @@ def update_decision_recency(decisions_path=None):
         "archived": 0,
         "transitions": 0,
     }
+    changed = False
 
     # Update each decision
     for decision in decisions:
+        had_status = "status" in decision
         old_status = decision.get("status", "active")
 
         # Parse commit date
@@ -95,10 +101,16 @@ def update_decision_recency(decisions_path=None):
 
         if old_status != new_status:
             stats["transitions"] += 1
+        if old_status != new_status or not had_status:
+            changed = True
+
+    # Nothing to record: leave the file (and its formatting) untouched
+    if not changed:
+        return stats
 
     # Write updated decisions
     with open(decisions_path, "w") as f:
-        yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(data, f, Dumper=YAML_DUMPER, default_flow_style=False, sort_keys=False)
 
     return stats
 
@@ -1,12 +1,24 @@
 #!/usr/bin/env python3
-"""Basic schema validation for ledger patterns."""
+"""Basic schema validation for ledger patterns.
+
+--incremental skips files unchanged (mtime and size) since they last passed.
+"""
 
 import yaml
+import json
+import os
 import sys
 from pathlib import Path
 
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from packages.common.serialization import YAML_LOADER
+
 REQUIRED_PATTERN_FIELDS = ['pattern', 'instances', 'last_updated']
 
+# --incremental: files that passed, keyed by path with their mtime and size
+VALIDATE_CACHE_FILE = Path('./.ledger_validate_cache.json')
+
 def validate_pattern(pattern_data, file_path, pattern_name):
     """Check pattern has required fields."""
     errors = []
@@ -21,24 +33,73 @@ def validate_pattern(pattern_data, file_path, pattern_name):
 
     return errors
 
+def validate_file(yaml_file):
+    """Return the schema errors for one ledger YAML file."""
+    errors = []
+    try:
+        with open(yaml_file) as f:
+            data = yaml.load(f, Loader=YAML_LOADER)
+
+        # Check for patterns in data
+        if isinstance(data, dict) and 'observed_patterns' in data:
+            patterns = data['observed_patterns']
+            for name, pattern in patterns.items():
+                errors.extend(validate_pattern(pattern, yaml_file, name))
+
+    except Exception as e:
+        errors.append(f"{yaml_file}: Parse error - {e}")
+
+    return errors
+
+def _file_key(path):
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+def load_validate_cache():
+    """Return {path: [mtime_ns, size]} for files that passed last time."""
+    try:
+        with open(VALIDATE_CACHE_FILE) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    # Entries only hold while the required fields are unchanged
+    if not isinstance(cache, dict) or cache.get('fields') != REQUIRED_PATTERN_FIELDS:
+        return {}
+    return cache.get('files', {})
+
+def save_validate_cache(passed):
+    """Atomically write the passed-files cache (best effort)."""
+    try:
+        tmp_file = VALIDATE_CACHE_FILE.with_name(f"{VALIDATE_CACHE_FILE.name}.{os.getpid()}.tmp")
+        with open(tmp_file, 'w') as f:
+            json.dump({'fields': REQUIRED_PATTERN_FIELDS, 'files': passed}, f)
+        os.replace(tmp_file, VALIDATE_CACHE_FILE)
+    except OSError:
+        pass
+
 def main():
-    ledger_files = Path('./ledger').rglob('*.yaml')
+    incremental = "--incremental" in sys.argv
+    ledger_files = list(Path('./ledger').rglob('*.yaml'))
     all_errors = []
 
+    if incremental:
+        # Unchanged files that passed last time cannot produce errors
+        cached = load_validate_cache()
+        keys = {str(path): _file_key(path) for path in ledger_files}
+        passed = {path: key for path, key in keys.items() if key is not None and cached.get(path) == key}
+        ledger_files = [path for path in ledger_files if str(path) not in passed]
+
     for yaml_file in ledger_files:
-        try:
-            with open(yaml_file) as f:
-                data = yaml.safe_load(f)
-
-            # Check for patterns in data
-            if isinstance(data, dict) and 'observed_patterns' in data:
-                patterns = data['observed_patterns']
-                for name, pattern in patterns.items():
-                    errors = validate_pattern(pattern, yaml_file, name)
-                    all_errors.extend(errors)
-
-        except Exception as e:
-            all_errors.append(f"{yaml_file}: Parse error - {e}")
+        errors = validate_file(yaml_file)
+        all_errors.extend(errors)
+        if incremental and not errors and keys[str(yaml_file)] is not None:
+            passed[str(yaml_file)] = keys[str(yaml_file)]
+
+    if incremental:
+        save_validate_cache(passed)
 
     if all_errors:
         print("❌ Schema validation failed:")
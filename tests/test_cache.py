@@ -0,0 +1,56 @@
+"""
+Test packages/common/cache.py.
+
+Tests owner-only permissions, corrupt entries and pruning.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from packages.common import cache
+
+
+def test_write_cache_is_owner_only_even_in_existing_dir(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "operator-ledger"
+    cache_dir.mkdir(mode=0o755)
+    cache_dir.chmod(0o755)  # As left by a tool that created it with the default mode
+    monkeypatch.setattr(cache, "CACHE_DIR", cache_dir)
+    source = tmp_path / "session.jsonl"
+    source.write_text("{}\n")
+
+    entry = cache.cache_path("skill_detect", source)
+    cache.write_cache(entry, {"key": cache.stat_key(source)})
+
+    assert cache_dir.stat().st_mode & 0o777 == 0o700
+    assert entry.stat().st_mode & 0o777 == 0o600
+    assert cache.read_cache(entry) == {"key": [3, source.stat().st_mtime_ns]}
+
+
+def test_read_cache_treats_corrupt_entries_as_missing(tmp_path):
+    corrupt = tmp_path / "x.json"
+    corrupt.write_text("{not json")
+    listing = tmp_path / "y.json"
+    listing.write_text("[1, 2]")
+
+    assert cache.read_cache(corrupt) is None
+    assert cache.read_cache(listing) is None
+    assert cache.read_cache(tmp_path / "missing.json") is None
+    assert cache.stat_key(tmp_path / "missing.json") is None
+
+
+def test_prune_cache_keeps_only_listed_sources(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path / "cache")
+    kept, gone = tmp_path / "kept.json", tmp_path / "gone.json"
+    for source in (kept, gone):
+        cache.write_cache(cache.cache_path("skill_detect", source), {})
+    cache.write_cache(cache.cache_path("skill_refs", gone), {})
+
+    cache.prune_cache("skill_detect", [kept])
+
+    assert sorted(path.name for path in (tmp_path / "cache").iterdir()) == sorted([
+        cache.cache_path("skill_detect", kept).name,
+        cache.cache_path("skill_refs", gone).name,
+    ])
@@ -186,3 +186,22 @@ def test_parse_gemini_session_returns_valid_session_envelope():
         assert field in result, f"Missing required field: {field}"
 
     assert result["source"] == "gemini-cache"
+
+
+def test_parse_cache_session_accepts_non_strict_json(tmp_path):
+    """Test JSONL lines outside orjson's dialect (NaN, big ints) still parse."""
+    cache_file = tmp_path / "session.jsonl"
+    cache_file.write_text(
+        '{"type": "summary", "summary": "Café work", "score": NaN}\n'
+        '\n'
+        '{"type": "user", "sessionId": "abc", "cwd": "/tmp/p", "gitBranch": "main", '
+        '"timestamp": "2025-11-01T10:00:00Z", "tokens": 123456789012345678901234567890}\n',
+        encoding="utf-8",
+    )
+
+    result = parse_cache_session(cache_file)
+
+    assert result["summary"] == "Café work"
+    assert result["session_id"] == "abc"
+    assert result["start_time"] == "2025-11-01T10:00:00Z"
+    assert result["source"] == "claude-code-cache"
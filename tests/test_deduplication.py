@@ -118,6 +118,22 @@ def test_deduplication_prevents_re_ingestion():
     assert len(history["processed_sessions"]) == prev_count  # No duplicate added
 
 
+def test_processed_session_index_stays_in_sync():
+    """The session index answers like the history scan and is updated on mark."""
+    from packages.capture.deduplication import index_processed_sessions
+
+    history = {"processed_sessions": [{"session_id": "a"}]}
+    processed_ids = index_processed_sessions(history)
+
+    assert is_session_processed(history, "a", processed_ids) is True
+    mark_session_processed(history, "b", "skill-analysis", "/b.jsonl", processed_ids=processed_ids)
+    mark_session_processed(history, "b", "skill-analysis", "/b.jsonl", processed_ids=processed_ids)
+
+    assert processed_ids == {"a", "b"}
+    assert [e["session_id"] for e in history["processed_sessions"]] == ["a", "b"]
+    assert is_session_processed(history, "b") is True
+
+
 def test_fallback_matching_by_timestamp_and_project():
     """Test fallback matching when session_id is missing/malformed."""
     from packages.capture.deduplication import is_duplicate_by_timestamp_and_project
@@ -0,0 +1,150 @@
+"""
+Test packages/common/parallel.py and the process pools gated by it.
+
+Each pooled workload must produce exactly what its serial path produces.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+# Add project root and scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from packages.common import cache, parallel
+from packages.common.parallel import file_size, pool_workers, process_pool
+
+
+def _write_transcripts(data_dir, session_ids):
+    data_dir.mkdir()
+    for i, session_id in enumerate(session_ids):
+        (data_dir / f"TerminalSavedOutput_2511{20 + i}-101500.json").write_text(json.dumps({
+            "session_id": session_id,
+            "start_time": f"2025-11-{20 + i}T10:15:00Z",
+            "interactions": [{"type": "user_prompt", "content": f"gh pr {i}, run python3; all tests passed"}],
+        }))
+    (data_dir / "TerminalSavedOutput_251130-000000.json").write_text("{}")
+    (data_dir / "TerminalSavedOutput_251131-000000.json").write_text("{not json")
+
+
+def _session_tracker_legacy_batch(tmp_path, monkeypatch, capsys):
+    import session_tracker
+
+    _write_transcripts(tmp_path / "data", ["a1", "b2", "a1", "c3"])
+    projects_yaml = tmp_path / "repos.yaml"
+    projects_yaml.write_text(yaml.safe_dump({"repositories": [{"name": "operator-ledger"}]}))
+
+    def run():
+        sessions_yaml = tmp_path / "sessions.yaml"
+        sessions_yaml.unlink(missing_ok=True)
+        monkeypatch.setattr(sys, "argv", [
+            "session_tracker.py", "--transcript-dir", str(tmp_path / "data"),
+            "--projects-yaml", str(projects_yaml), "--sessions-yaml", str(sessions_yaml),
+        ])
+        assert session_tracker.main() == 0
+        sessions = yaml.safe_load(sessions_yaml.read_text())["sessions"]
+        for session in sessions:
+            del session["ingestion_metadata"]["ingested_at"]
+        return sessions, capsys.readouterr().out
+
+    return session_tracker, "PARALLEL_TRANSCRIPT_MIN_BYTES", run
+
+
+def _skill_ingestion_transcript_files(tmp_path, monkeypatch, capsys):
+    import skill_ingestion
+
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(skill_ingestion.Path, "home", lambda: tmp_path / "home")
+    _write_transcripts(tmp_path / "data", ["s0", "s1", "s2"])
+    project_dir = tmp_path / "home" / ".claude" / "projects" / "p"
+    project_dir.mkdir(parents=True)
+    for i in range(3):
+        (project_dir / f"c{i}.jsonl").write_text(json.dumps({
+            "type": "user", "sessionId": f"c{i}", "message": {"content": f"cached {i}"},
+        }) + "\n")
+
+    def run():
+        return skill_ingestion.parse_transcripts(tmp_path / "data"), capsys.readouterr().out
+
+    return skill_ingestion, "PARALLEL_PARSE_MIN_BYTES", run
+
+
+def _skill_ingestion_detections(tmp_path, monkeypatch, capsys):
+    import skill_ingestion
+
+    transcripts = [
+        {"start_time": f"2025-11-2{i}", "interactions": [{
+            "type": "user_prompt", "id": "i1",
+            "content": f"IAW the PRD {i}, run python3 and track progress on the roadmap; all tests passed",
+        }]}
+        for i in range(5)
+    ]
+
+    def run():
+        # History sessions carry no source_stat, so nothing is served from cache
+        return list(skill_ingestion._map_detections(transcripts))
+
+    return skill_ingestion, "PARALLEL_DETECT_MIN_CHARS", run
+
+
+def _query_sessions_line_references(tmp_path, monkeypatch, capsys):
+    import query_sessions
+
+    skills_file = tmp_path / "skills.yaml"
+    skills_file.write_text(
+        "skills:\n"
+        "  orchestration:\n    - skill: Project Management\n      evidence:\n        - a\n"
+        "  tech_stack:\n    - skill: Python\n      evidence:\n        - b\n        - c\n"
+        "other:\n  - skill: Outside\n"
+    )
+
+    def run():
+        return query_sessions.build_skill_line_references_parallel(skills_file)
+
+    return query_sessions, "PARALLEL_SCAN_MIN_BYTES", run
+
+
+@pytest.mark.parametrize("workload", [
+    _session_tracker_legacy_batch,
+    _skill_ingestion_transcript_files,
+    _skill_ingestion_detections,
+    _query_sessions_line_references,
+], ids=lambda workload: workload.__name__.lstrip("_"))
+def test_pooled_workload_matches_serial(workload, tmp_path, monkeypatch, capsys):
+    module, threshold, run = workload(tmp_path, monkeypatch, capsys)
+    monkeypatch.setattr(parallel.os, "cpu_count", lambda: 2)
+    pools = []
+    monkeypatch.setattr(module, "process_pool", lambda workers: pools.append(workers) or process_pool(workers))
+
+    monkeypatch.setattr(module, threshold, 1 << 40)
+    serial = run()
+    assert pools == []
+    monkeypatch.setattr(module, threshold, 0)
+    pooled = run()
+
+    assert pools and all(workers == 2 for workers in pools)
+    assert serial
+    assert pooled == serial
+
+
+def test_pool_workers_gating(monkeypatch):
+    monkeypatch.setattr(parallel.os, "cpu_count", lambda: 4)
+    assert pool_workers(10, 100, 100) == 4
+    assert pool_workers(3, 100, 100) == 3
+    assert pool_workers(10, 99, 100) == 0
+    assert pool_workers(1, 100, 0) == 0
+
+    monkeypatch.setattr(parallel.os, "cpu_count", lambda: None)
+    assert pool_workers(10, 100, 0) == 0
+
+
+def test_file_size(tmp_path):
+    path = tmp_path / "a.json"
+    path.write_text("12345")
+
+    assert file_size(path) == 5
+    assert file_size(tmp_path / "missing.json") == 0
@@ -0,0 +1,280 @@
+"""
+Test query_sessions.py script.
+
+Tests skill line references, skill/confidence/project queries, and time filtering.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path to import the script
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from query_sessions import (
+    build_skill_line_references,
+    query_by_skill,
+    query_by_confidence,
+)
+
+# The script put the project root on sys.path
+from packages.common import cache
+
+
+SKILLS_YAML = """\
+skills:
+  orchestration:
+    - skill: Project Management
+      level: 2
+      evidence:
+        - "Led sprint planning"
+        - "Tracked milestones"
+      temporal_metadata:
+        confidence_score: 40
+        trend: rising
+        session_count: 4
+        evidence_quality: weak
+    - skill: "Risk Analysis"
+      level: 1
+      evidence: "single line"
+      temporal_metadata:
+        confidence_score: 20
+  tech_stack:
+    languages:
+      - skill: Python Development
+        level: 3
+        evidence:
+          - "Wrote scripts"
+          - |
+            multi line
+            block
+        temporal_metadata:
+          confidence_score: 80
+"""
+
+
+@pytest.fixture
+def skills_file(tmp_path):
+    """Write a small skills ledger and return its path."""
+    path = tmp_path / "skills.yaml"
+    path.write_text(SKILLS_YAML)
+    return path
+
+
+@pytest.fixture
+def skills_data(skills_file):
+    import yaml
+    return yaml.safe_load(skills_file.read_text())
+
+
+def test_line_references_for_evidence_array(skills_file):
+    """Evidence arrays map to the lines between 'evidence:' and the next key."""
+    refs = build_skill_line_references(skills_file)
+
+    assert refs["Project Management"] == {
+        "file": "ledger/skills.yaml",
+        "definition_line": 3,
+        "evidence_start": 5,
+        "evidence_end": 7,
+    }
+    # Block scalar items extend the evidence range
+    assert refs["Python Development"]["evidence_start"] == 22
+    assert refs["Python Development"]["evidence_end"] == 26
+
+
+def test_line_references_string_evidence_has_no_range(skills_file):
+    """Quoted skill names are unquoted; string evidence yields no range."""
+    refs = build_skill_line_references(skills_file)
+
+    assert refs["Risk Analysis"]["definition_line"] == 13
+    assert refs["Risk Analysis"]["evidence_start"] is None
+    assert refs["Risk Analysis"]["evidence_end"] is None
+
+
+def test_query_by_skill_with_references(skills_file, skills_data):
+    refs = build_skill_line_references(skills_file)
+
+    result = query_by_skill("project management", skills_data, {}, refs)
+
+    assert result["results"]["skill_confidence"] == 40
+    assert result["results"]["skill_category"] == "orchestration"
+    assert result["results"]["references"] == {
+        "definition": "ledger/skills.yaml:3",
+        "evidence_source": "ledger/skills.yaml:5-7",
+    }
+
+
+def test_query_by_skill_not_found_lists_hints(skills_data):
+    result = query_by_skill("Unknown", skills_data, {})
+
+    assert "error" in result
+    assert result["available_skills"] == [
+        "Project Management", "Risk Analysis", "Python Development"
+    ]
+
+
+def test_query_by_confidence_sorted_lowest_first(skills_data):
+    result = query_by_confidence(50, skills_data)
+
+    names = [s["skill_name"] for s in result["results"]["skills"]]
+    assert names == ["Risk Analysis", "Project Management"]
+    assert result["results"]["matching_skills_count"] == 2
+
+
+def test_cached_line_references_invalidate_on_edit(skills_file, tmp_path, monkeypatch):
+    """Cached references are reused until the YAML contents change."""
+    import query_sessions
+
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path / "cache")
+
+    first = query_sessions.cached_skill_line_references(skills_file)
+    assert first == build_skill_line_references(skills_file)
+    assert len(list((tmp_path / "cache").glob("skill_refs_*.json"))) == 1
+
+    skills_file.write_text("# header comment\n" + SKILLS_YAML)
+    second = query_sessions.cached_skill_line_references(skills_file)
+    assert second["Project Management"]["definition_line"] == 4
+    assert len(list((tmp_path / "cache").glob("skill_refs_*.json"))) == 1
+
+
+def test_line_references_target_names_only_records_targets(skills_file):
+    """A targeted scan matches the full scan for the requested skill only."""
+    full = build_skill_line_references(skills_file)
+    refs = build_skill_line_references(skills_file, target_names={"risk analysis"})
+
+    assert refs == {"Risk Analysis": full["Risk Analysis"]}
+
+
+def test_filter_by_time_window_mixed_date_formats():
+    """Naive, 'Z'-suffixed and unparseable dates are all handled."""
+    from datetime import datetime, timedelta, timezone
+    from query_sessions import filter_by_time_window
+
+    now = datetime.now()
+    recent_utc = (datetime.now(timezone.utc) - timedelta(days=1)).strftime("%Y-%m-%dT%H:%M:%SZ")
+    results = {
+        "query": {"type": "project", "filters": {}},
+        "results": {
+            "sessions": [
+                {"session_id": "a", "date": (now - timedelta(days=2)).isoformat()},
+                {"session_id": "b", "date": (now - timedelta(days=30)).isoformat()},
+                {"session_id": "c", "date": recent_utc},
+                {"session_id": "d", "date": "not-a-date"},
+                {"session_id": "e", "date": ""},
+            ]
+        },
+    }
+
+    filtered = filter_by_time_window(results, 7)
+
+    assert [s["session_id"] for s in filtered["results"]["sessions"]] == ["a", "c"]
+    assert filtered["results"]["session_count"] == 2
+    assert filtered["query"]["filters"]["last_n_days"] == 7
+
+
+def test_query_by_project_substring_match_keeps_index_order(tmp_path, monkeypatch):
+    """Project queries match project_id substrings, in transcript index order."""
+    import json
+    import query_sessions
+
+    transcripts_index = {
+        "index": [
+            {"session_id": "s1", "created_date": "2026-01-01",
+             "tags": {"project_id": "voice-pipeline", "workflow": ["debug"]}},
+            {"session_id": "s2", "created_date": "2026-01-02",
+             "tags": {"project_id": "operator-ledger"}},
+            {"session_id": "s3", "created_date": "2026-01-03",
+             "tags": {"project_id": "Voice-Pipeline-v2"}},
+        ]
+    }
+    index_path = tmp_path / "transcripts_index.json"
+    index_path.write_text(json.dumps(transcripts_index))
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path / "cache")
+
+    project_index = query_sessions.cached_project_index(index_path, transcripts_index)
+    # Second call is served from the on-disk cache
+    assert query_sessions.cached_project_index(index_path, transcripts_index) == project_index
+
+    result = query_sessions.query_by_project("VOICE-pipe", transcripts_index, project_index)
+
+    assert [s["session_id"] for s in result["results"]["sessions"]] == ["s1", "s3"]
+    assert result["results"]["sessions"][0]["workflows"] == ["debug"]
+    assert result == query_sessions.query_by_project("VOICE-pipe", transcripts_index)
+
+
+def test_flatten_skills_rows(skills_data):
+    from query_sessions import flatten_skills
+
+    rows = flatten_skills(skills_data)
+
+    assert [row.name for row in rows] == ["Project Management", "Risk Analysis", "Python Development"]
+    row = rows[2]
+    assert row.category == "tech_stack/languages"
+    assert row.confidence == 80
+    assert row.trend == "unknown"
+
+
+def test_session_in_window_utc_fast_path_matches_parse():
+    """String-compared UTC dates agree with full datetime parsing around the cutoff."""
+    from datetime import datetime, timedelta, timezone
+    from query_sessions import _session_in_window
+
+    cutoff_aware = datetime(2026, 3, 1, 12, 0, 0, 500000, tzinfo=timezone.utc)
+    cutoff = cutoff_aware.astimezone().replace(tzinfo=None)
+    cutoff_utc = "2026-03-01T12:00:00"
+
+    for date_str in ("2026-03-01T11:59:59Z", "2026-03-01T12:00:00Z",
+                     "2026-03-01T12:00:00.750000Z", "2026-03-01T12:00:01Z",
+                     "2026-02-28T23:00:00.1Z", "2027-01-01T00:00:00Z"):
+        expected = _session_in_window(date_str, cutoff, cutoff_aware)
+        assert _session_in_window(date_str, cutoff, cutoff_aware, cutoff_utc) == expected, date_str
+
+
+def test_load_skills_memoized_until_file_changes(tmp_path):
+    """Repeated loads reuse the parse until the file is rewritten."""
+    import os
+    from query_sessions import _load_skills_pickled, load_skills
+
+    ledger_dir = tmp_path / "packages" / "ledger"
+    ledger_dir.mkdir(parents=True)
+    skills_path = ledger_dir / "skills.yaml"
+    skills_path.write_text(SKILLS_YAML)
+
+    _load_skills_pickled.cache_clear()
+    first, path = load_skills(tmp_path)
+    assert path == skills_path
+    # Each call gets a private copy of the memoized parse
+    first["skills"]["orchestration"][0]["level"] = 9
+    again, _ = load_skills(tmp_path)
+    assert again["skills"]["orchestration"][0]["level"] == 2
+    assert _load_skills_pickled.cache_info().hits == 1
+
+    skills_path.write_text(SKILLS_YAML.replace("level: 2", "level: 4", 1))
+    stat = skills_path.stat()
+    os.utime(skills_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    reloaded, _ = load_skills(tmp_path)
+    assert reloaded["skills"]["orchestration"][0]["level"] == 4
+
+
+def test_limit_results_truncates_rows_not_counts(skills_data):
+    from query_sessions import limit_results
+
+    result = limit_results(query_by_confidence(90, skills_data), 1)
+
+    assert [s["skill_name"] for s in result["results"]["skills"]] == ["Risk Analysis"]
+    assert result["results"]["matching_skills_count"] == 3
+    assert result["query"]["filters"]["limit"] == 1
+
+
+def test_memoized_line_references_are_private_copies(skills_file):
+    """Mutating one caller's references does not leak into later calls."""
+    refs = build_skill_line_references(skills_file)
+    refs["Risk Analysis"]["definition_line"] = 0
+    del refs["Project Management"]
+
+    again = build_skill_line_references(skills_file)
+
+    assert again["Risk Analysis"]["definition_line"] == 13
+    assert "Project Management" in again
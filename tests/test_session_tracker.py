@@ -0,0 +1,196 @@
+"""
+Test session_tracker.py script.
+
+Tests skill detection, working directory/project inference, continuation
+detection, and history.jsonl batch ingestion.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import yaml
+
+# Add parent directory to path to import the script
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from session_tracker import (
+    detect_skills_in_session,
+    extract_working_directory,
+    match_project_from_directory,
+    filenames_similar,
+    parse_history_jsonl,
+    convert_history_session_to_transcript,
+    process_transcript,
+    index_sessions,
+    detect_continuation,
+    index_continuation_candidates,
+    index_projects,
+)
+
+
+PROJECTS = [
+    {"name": "Voice Pipeline (v2)", "alias": "voice-pipeline"},
+    {"name": "operator-ledger"},
+]
+
+
+def test_detect_skills_in_user_prompts_only():
+    """Skills are detected from user prompts, not assistant responses."""
+    interactions = [
+        {"type": "user_prompt", "content": "Let's weigh the TRADE-OFFS and open a GitHub issue"},
+        {"type": "assistant_response", "content": "I documented a recurring pattern"},
+        {"type": "user_prompt", "content": "then gh pr create"},
+    ]
+
+    assert detect_skills_in_session(interactions) == [
+        "Critical Thinking & Evaluation",
+        "GitHub MCP Integration",
+        "Project Management",
+    ]
+
+
+def test_extract_working_directory_prefers_explicit_field():
+    interactions = [
+        {"content": "cwd: /tmp/elsewhere"},
+        {"content": "", "working_dir": "/Users/me/operator-ledger"},
+    ]
+
+    assert extract_working_directory(interactions) == "/Users/me/operator-ledger"
+
+
+def test_extract_working_directory_from_content_requires_absolute_path():
+    interactions = [
+        {"content": "cd src"},
+        {"content": "Working directory: `/Users/me/voice-pipeline`"},
+    ]
+
+    assert extract_working_directory(interactions) == "/Users/me/voice-pipeline"
+
+
+def test_match_project_exact_then_partial():
+    exact = match_project_from_directory("/Users/me/Voice-Pipeline/src", PROJECTS)
+    assert exact == {
+        "project_id": "voice-pipeline",
+        "project_name": "Voice Pipeline (v2)",
+        "inferred_from": "working_directory_match",
+    }
+
+    partial = match_project_from_directory("/work/voice pipeline", PROJECTS)
+    assert partial["inferred_from"] == "working_directory_partial_match"
+    assert partial["project_name"] == "Voice Pipeline (v2)"
+
+    assert match_project_from_directory("/work/voice pipeline", PROJECTS,
+                                        index_projects(PROJECTS)) == partial
+    assert match_project_from_directory("/tmp/unrelated", PROJECTS) is None
+    assert match_project_from_directory(None, PROJECTS) is None
+
+
+def test_filenames_similar():
+    assert filenames_similar("TerminalSavedOutput_251120-101500.json",
+                             "TerminalSavedOutput_251120-143000.json")
+    assert not filenames_similar("TerminalSavedOutput_251120-101500.json",
+                                 "TerminalSavedOutput_251121-101500.json")
+    assert filenames_similar("Terminal Saved Output.json", "terminal_saved_output (2).json")
+
+
+def test_parse_history_groups_and_orders_sessions(tmp_path):
+    history = tmp_path / "history.jsonl"
+    lines = [
+        {"sessionId": "s1", "timestamp": 2000, "display": "second", "project": "/p"},
+        {"sessionId": "s2", "timestamp": 1500, "display": "other"},
+        {"display": "no session"},
+        {"sessionId": "s1", "timestamp": 1000, "display": "first", "project": "/p"},
+    ]
+    history.write_text("\n".join(json.dumps(line) for line in lines) + "\n\n")
+
+    sessions = parse_history_jsonl(history)
+    assert list(sessions) == ["s1", "s2"]
+    assert len(sessions["s1"]) == 2
+
+    transcript = convert_history_session_to_transcript("s1", sessions["s1"])
+    assert [i["content"] for i in transcript["interactions"]] == ["first", "second"]
+    assert transcript["interactions"][0]["working_dir"] == "/p"
+    assert transcript["start_time"] < transcript["end_time"]
+
+
+def test_detect_skills_overlapping_matches():
+    """A match for one skill never hides an overlapping match for another."""
+    interactions = [{"type": "user_prompt", "content": "run gh issue 12 now"}]
+
+    assert detect_skills_in_session(interactions) == [
+        "GitHub MCP Integration",
+        "Project Management",
+    ]
+
+
+def test_process_transcript_updates_sessions_in_memory(tmp_path):
+    """Transcripts are added to the shared sessions data; duplicates are skipped."""
+    transcript = tmp_path / "TerminalSavedOutput_251120-101500.json"
+    transcript.write_text(json.dumps({
+        "session_id": "abc12345",
+        "start_time": "2025-11-20T10:15:00Z",
+        "end_time": "2025-11-20T10:45:00Z",
+        "interactions": [
+            {"type": "user_prompt", "content": "cd /Users/me/operator-ledger and check milestone"},
+        ],
+    }))
+    sessions_data = {"sessions": []}
+    session_index = index_sessions(sessions_data["sessions"])
+
+    assert process_transcript(transcript, PROJECTS, sessions_data, tmp_path, session_index)
+    assert not process_transcript(transcript, PROJECTS, sessions_data, tmp_path, session_index)
+    assert not process_transcript(transcript, PROJECTS, sessions_data, tmp_path)
+
+    [session] = sessions_data["sessions"]
+    assert session_index == {"abc12345": session}
+    assert session["transcript_path"] == transcript.name
+    assert session["duration_minutes"] == 30.0
+    assert session["skills_demonstrated"] == ["Project Management"]
+    assert session["project_context"]["project_id"] == "operator-ledger"
+    assert "interactions" not in session
+
+
+def test_index_sessions_keeps_first_duplicate():
+    first, second = {"session_id": "a", "n": 1}, {"session_id": "a", "n": 2}
+
+    assert index_sessions([first, second, {"session_id": "b"}])["a"] is first
+
+
+def test_parse_history_accepts_stdlib_only_json(tmp_path):
+    """Records orjson rejects (NaN, >64-bit ints) still parse via stdlib json."""
+    history = tmp_path / "history.jsonl"
+    history.write_text(
+        '{"sessionId": "s1", "timestamp": 1, "display": "café"}\n'
+        '{"sessionId": "s1", "timestamp": NaN, "n": 123456789012345678901234567890}\n'
+    )
+
+    entries = parse_history_jsonl(history)["s1"]
+    assert entries[0]["display"] == "café"
+    assert entries[1]["n"] == 123456789012345678901234567890
+
+
+def test_detect_continuation_by_overlap_and_proximity():
+    """Continuations match on interaction-ID overlap or time + filename + directory."""
+    existing = [
+        {"session_id": "old", "start_time": "2025-11-01T09:00:00Z",
+         "transcript_path": "a.json", "interactions": [{"id": "1"}, {"id": "2"}]},
+        {"session_id": "near", "start_time": "2025-11-20T09:00:00Z",
+         "transcript_path": "TerminalSavedOutput_251120-090000.json",
+         "working_directory": "/p", "interactions": [{"id": "9"}]},
+        {"session_id": "saved", "start_time": "2025-11-20T09:30:00Z",
+         "transcript_path": "TerminalSavedOutput_251120-093000.json"},
+    ]
+    existing = index_continuation_candidates(existing)
+    assert [session["session_id"] for session, _, _ in existing] == ["old", "near"]
+    overlapping = [{"id": "1"}, {"id": "2"}, {"id": "3"}]
+    fresh = [{"id": "7"}]
+
+    assert detect_continuation(overlapping, "2025-11-20T10:00:00Z", "x.json", None, existing) == "old"
+    assert detect_continuation(fresh, "2025-11-20T11:00:00Z",
+                               "TerminalSavedOutput_251120-110000.json", "/p", existing) == "near"
+    assert detect_continuation(fresh, "2025-11-20T11:00:00Z",
+                               "TerminalSavedOutput_251120-110000.json", "/q", existing) is None
+    assert detect_continuation(fresh, "2025-11-20T14:00:00Z",
+                               "TerminalSavedOutput_251120-140000.json", "/p", existing) is None
+    assert detect_continuation(fresh, "not a date", "x.json", None, existing) is None
@@ -0,0 +1,331 @@
+"""
+Test skill_ingestion.py script.
+
+Tests orchestration/tech stack/outcome detection, skepticism analysis and
+cache transcript conversion.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import the script
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from skill_ingestion import (
+    analyze_skepticism,
+    convert_cache_to_transcript,
+    detect_leverage_context,
+    detect_orchestration_skills,
+    detect_tech_stack_skills,
+    detect_outcome_evidence,
+)
+
+# The script put the project root on sys.path
+from packages.common import cache
+
+
+def _prompt(content, interaction_id="i1"):
+    return {"type": "user_prompt", "content": content, "id": interaction_id}
+
+
+def test_strategic_and_orchestration_evidence_reports_source_patterns():
+    content = "IAW TICKET-011 follow the CRISP-E framework and track progress on the roadmap"
+    detections = detect_orchestration_skills([_prompt(content)])
+
+    framework = detections["Framework Design"]
+    assert framework["count"] == 1
+    assert framework["evidence"][0]["patterns"] == ["CRISP-E"]
+    assert framework["detection_breakdown"] == {"Framework Design": 1}
+
+    project = detections["Project Management"]
+    assert project["evidence"][0]["patterns"] == [r"TICKET-\d+", r"track.*progress", r"roadmap"]
+    assert project["leverage_context"]["strategic_patterns"] == 2
+    assert project["leverage_context"]["directive_instances"] == 1
+
+
+def test_compound_requirement_and_negative_patterns():
+    """Tier 3 skills need two patterns; negative patterns veto a skill."""
+    single = "This is a long enough prompt that only mentions one pattern in passing"
+    assert "Pattern Recognition" not in detect_orchestration_skills([_prompt(single)])
+
+    compound = "This recurring pattern keeps showing up, similar to the issue we saw last week"
+    assert detect_orchestration_skills([_prompt(compound)])["Pattern Recognition"]["count"] == 3
+
+    vetoed = "This recurring pattern_matching helper is similar to the one in utils today"
+    assert "Pattern Recognition" not in detect_orchestration_skills([_prompt(vetoed)])
+
+
+def test_short_prompts_skip_orchestration_but_not_strategic():
+    detections = detect_orchestration_skills([_prompt("IAW the PRD, track progress")])
+
+    assert set(detections) == {"Specification Engineering"}
+
+
+def test_tech_stack_counts_once_per_skill_per_interaction():
+    interactions = [
+        {"content": "run python3 script.py with pip", "id": "a"},
+        {"content": "edit config.yaml and README.md", "id": "b"},
+    ]
+
+    detections = detect_tech_stack_skills(interactions, "2025-11-20")
+
+    assert detections["tech_stack.dev_tooling.Python"]["count"] == 1
+    assert detections["tech_stack.dev_tooling.Python"]["sessions"] == ["2025-11-20"]
+    assert detections["tech_stack.data_formats.YAML"]["evidence"][0]["interaction_id"] == "b"
+    assert "tech_stack.data_formats.Markdown" in detections
+
+
+def test_outcome_evidence_references():
+    interactions = [{
+        "content": "All 42 tests passed and PR #17 merged PR into main",
+        "id": "x",
+        "timestamp": "2025-11-20T10:00:00",
+    }]
+
+    outcomes = detect_outcome_evidence(interactions)
+
+    assert [o["reference"] for o in outcomes["tests_passed"]] == ["metric:42"]
+    assert [o["reference"] for o in outcomes["github_pr"]] == ["github:pr/17"]
+    assert outcomes["code_shipped"][0]["date"] == "2025-11-20"
+
+
+def test_skepticism_and_leverage():
+    assert analyze_skepticism("  Sounds good! ") == (True, "passive_observation")
+    assert analyze_skepticism("go ahead") == (True, "blind_acceptance")
+    assert analyze_skepticism("How does caching work?") == (True, "learning_discussion")
+    assert analyze_skepticism("Refactor the parser") == (False, "active_demonstration")
+
+    leverage = detect_leverage_context("Actually, fix the gate system and explain why")
+    assert leverage == {
+        "strategic_patterns": 1,
+        "directive_instances": 0,
+        "evaluative_instances": 1,
+        "iterative_instances": 1,
+        "learning_instances": 1,
+    }
+
+
+def test_literal_patterns_match_like_ignorecase_regex():
+    """Literal patterns use substring search on ASCII text; non-ASCII text uses the regex."""
+    base = "We should write down the lessons learned and the main {} from this sprint"
+
+    for word in ("takeaway", "TAKEAWAY", "TaKeAwAy", "ta\u212aeaway"):
+        detections = detect_orchestration_skills([_prompt(base.format(word))])
+        assert "takeaway" in detections["Framework Iteration"]["evidence"][0]["patterns"], word
+
+    detections = detect_tech_stack_skills([{"content": "edit AGENTS.MD", "id": "a"}])
+    assert "tech_stack.data_formats.Markdown" in detections
+
+
+def test_literal_prefix_is_required_by_every_match():
+    from skill_ingestion import _literal_prefix
+
+    assert _literal_prefix(r"AGENTS\.md") == ("agents.md", True)
+    assert _literal_prefix(r"track.*progress") == ("track", False)
+    assert _literal_prefix(r"python3?") == ("python", False)
+    assert _literal_prefix(r"\bpattern\s*(string|matching)") == ("pattern", False)
+    assert _literal_prefix(r"TICKET-\d+") == ("ticket-", False)
+    assert _literal_prefix(r"ab+c") == ("ab", False)
+    assert _literal_prefix(r"(in)?feasible") == (None, False)
+    assert _literal_prefix(r"foo|bar") == (None, False)
+    assert _literal_prefix(r"a[|]b") == ("a", False)
+
+
+def test_convert_cache_to_transcript_reads_user_entries(tmp_path):
+    cache_file = tmp_path / "session.jsonl"
+    entries = [
+        {"type": "summary", "summary": "user asked"},
+        {"type": "assistant", "sessionId": "s1", "message": {"content": [{"type": "text", "text": "hi"}]}},
+        {"type": "user", "sessionId": "s2", "uuid": "u1", "cwd": "/p",
+         "timestamp": "2025-12-22T13:57:07.298431",
+         "message": {"content": [{"type": "text", "text": "a"}, {"type": "tool_result"},
+                                 {"type": "text", "text": "b"}]}},
+        {"type": "user", "uuid": "u2", "message": {"content": "plain"}},
+    ]
+    cache_file.write_text("\n".join(json.dumps(e) for e in entries) + "\n\n")
+
+    transcript = convert_cache_to_transcript(cache_file)
+
+    assert transcript["session_id"] == "s1"
+    assert transcript["start_time"] == "2025-12-22"
+    assert [i["content"] for i in transcript["interactions"]] == ["a\nb", "plain"]
+    assert transcript["interactions"][0]["working_dir"] == "/p"
+
+    # A partially written last line still rejects the file
+    with open(cache_file, "a") as f:
+        f.write('{"type": "assistant", "message"')
+    assert convert_cache_to_transcript(cache_file) is None
+
+
+def test_cached_transcripts_and_detections(tmp_path, monkeypatch):
+    """Memoized results match fresh ones and are invalidated by file or table changes."""
+    import skill_ingestion
+
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path / "cache")
+    cache_file = tmp_path / "session.jsonl"
+    entry = {"type": "user", "sessionId": "s1", "uuid": "u1", "timestamp": "2025-12-22T10:00:00",
+             "message": {"content": "IAW the PRD, run python3 and track progress on the roadmap now"}}
+    cache_file.write_text(json.dumps(entry) + "\n")
+
+    first = skill_ingestion.cached_cache_transcript(cache_file)
+    assert first == convert_cache_to_transcript(cache_file)
+    assert skill_ingestion.cached_cache_transcript(cache_file) == first
+
+    with open(cache_file, "a") as f:
+        f.write(json.dumps(dict(entry, uuid="u2")) + "\n")
+    assert len(skill_ingestion.cached_cache_transcript(cache_file)["interactions"]) == 2
+
+    transcript = skill_ingestion._load_cache_transcript(cache_file)
+    expected = (
+        detect_orchestration_skills(transcript["interactions"]),
+        detect_tech_stack_skills(transcript["interactions"], "2025-12-22"),
+        skill_ingestion.detect_outcome_evidence(transcript["interactions"]),
+    )
+    fresh = skill_ingestion.cached_detections(transcript)
+    fresh[0]["Project Management"]["evidence"][0]["source_file"] = "annotated by caller"
+    assert skill_ingestion.cached_detections(transcript) == expected
+    (memo_file,) = (tmp_path / "cache").glob("skill_detect_*.json")
+    assert memo_file.stat().st_mode & 0o777 == 0o600
+
+    # A grown file overwrites its one entry instead of adding another
+    with open(cache_file, "a") as f:
+        f.write(json.dumps(dict(entry, uuid="u3", message={"content": "all tests passed"})) + "\n")
+    grown = skill_ingestion._load_cache_transcript(cache_file)
+    assert skill_ingestion.cached_detections(grown)[2] == skill_ingestion.detect_outcome_evidence(grown["interactions"])
+    assert list((tmp_path / "cache").glob("skill_detect_*.json")) == [memo_file]
+
+    monkeypatch.setattr(skill_ingestion, "_PATTERN_TABLES_DIGEST", "changed")
+    monkeypatch.setattr(skill_ingestion, "detect_outcome_evidence", lambda interactions: {"rescanned": []})
+    assert skill_ingestion.cached_detections(grown)[2] == {"rescanned": []}
+
+
+def test_parse_transcripts_prunes_stale_cache_entries(tmp_path, monkeypatch):
+    """Entries for deleted sources and old digest-keyed entries are removed."""
+    import skill_ingestion
+
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(cache, "CACHE_DIR", cache_dir)
+    monkeypatch.setattr(skill_ingestion.Path, "home", lambda: tmp_path / "home")
+    project_dir = tmp_path / "home" / ".claude" / "projects" / "p"
+    project_dir.mkdir(parents=True)
+    for name in ("kept", "deleted"):
+        (project_dir / f"{name}.jsonl").write_text(json.dumps({
+            "type": "user", "sessionId": name, "message": {"content": "run python3 now"},
+        }) + "\n")
+    for transcript in skill_ingestion.parse_transcripts(tmp_path, include_history=False):
+        skill_ingestion.cached_detections(transcript)
+    (cache_dir / "skill_detect_0123456789abcdef.json").write_text("{}")
+    (project_dir / "deleted.jsonl").unlink()
+
+    skill_ingestion.parse_transcripts(tmp_path, include_history=False)
+
+    kept = project_dir / "kept.jsonl"
+    assert sorted(path.name for path in cache_dir.iterdir()) == sorted([
+        cache.cache_path("cache_transcript", kept).name,
+        cache.cache_path("skill_detect", kept).name,
+    ])
+
+
+def test_fold_case_keeps_escapes():
+    from skill_ingestion import _fold_case
+
+    assert _fold_case(r"TICKET-\d+\S*\B") == r"ticket-\d+\S*\B"
+    assert _fold_case(r"[\Wa-z]X") == r"[\Wa-z]x"
+    assert _fold_case(r"[A-z]") is None
+    assert _fold_case(r"(?P<Name>x)") is None
+    assert _fold_case("cafÉ") is None
+
+
+def test_outcome_evidence_overlapping_types_and_case():
+    """Each outcome type reports its own matches, in any letter case."""
+    outcomes = detect_outcome_evidence([{"content": "We DEPLOYED to Production today", "id": "x"}])
+
+    assert set(outcomes) == {"code_shipped", "production_deployed"}
+    assert outcomes["code_shipped"][0]["matched_text"] == "DEPLOYED to Production"
+    assert outcomes["production_deployed"][0]["matched_text"] == "DEPLOYED to Production"
+
+    # Non-ASCII text skips the prefix screen: the long s still matches "s"
+    long_s = detect_outcome_evidence([{"content": "\u017fhipped to users", "id": "y"}])
+    assert long_s["code_shipped"][0]["matched_text"] == "\u017fhipped to users"
+
+
+def test_readiness_signals():
+    from skill_ingestion import detect_readiness_signals
+
+    def readiness(*prompts, skill="Docker"):
+        return detect_readiness_signals([_prompt(p) for p in prompts], skill)[0]
+
+    assert readiness("I'd rather avoid", "Docker for now") == "avoid"
+    assert readiness("Not interested in that, I understand it", skill="Rust") == "ready_to_learn"
+    assert readiness("It's like make, and I worked with it") == "can_learn_quickly"
+    assert readiness("I understand the concept") == "ready_to_learn"
+    assert readiness("hello") == "not_ready"
+    assert detect_readiness_signals([{"type": "assistant_response", "content": "avoid Docker"}],
+                                    "Docker")[0] == "not_ready"
+
+
+def test_analyze_temporal_metadata_uses_recorded_session_dates():
+    from skill_ingestion import analyze_temporal_metadata
+
+    dates = ["2025-11-20", "2025-11-18", "2025-11-20", "2025-12-01"]
+
+    assert analyze_temporal_metadata("Framework Design", {"session_dates": dates}) == {
+        "first_seen": "2025-11-18",
+        "last_seen": "2025-12-01",
+        "session_count": 4,
+        "frequency": "regular",
+        "trend": "established",
+    }
+    assert analyze_temporal_metadata("Framework Design", {}) == {}
+
+
+def test_tech_stack_temporal_metadata_from_session_set():
+    from skill_ingestion import generate_temporal_metadata_for_tech_stack
+
+    metadata = generate_temporal_metadata_for_tech_stack(
+        "tech_stack.dev_tooling.Python", {"sessions": {"2025-11-20", "2025-11-18"}}
+    )
+
+    assert metadata["first_seen"] == "2025-11-18"
+    assert metadata["last_seen"] == "2025-11-20"
+    assert metadata["frequency"] == "occasional"
+
+
+def test_build_evidence_sessions_from_transcript_map():
+    from skill_ingestion import build_evidence_sessions
+
+    transcript_map = {"a.jsonl": {"session_id": "s1", "start_time": "2025-11-20T10:00:00Z"}}
+    samples = [
+        {"source_file": "a.jsonl", "interaction_id": "i1", "content": "x" * 101},
+        {"source_file": "TerminalSavedOutput_251121-101500.json", "interaction_id": "i2", "content": "y"},
+        {"interaction_id": "i3", "content": "no source"},
+    ]
+
+    sessions = build_evidence_sessions(samples, Path(""), transcript_map)
+
+    assert [(s["session_id"], s["date"]) for s in sessions] == [
+        ("s1", "2025-11-20"), ("unknown", "2025-11-21")
+    ]
+    assert sessions[0]["snippet"] == "x" * 100 + "..."
+
+
+def test_load_existing_skills_merges_active_and_history(tmp_path):
+    from skill_ingestion import load_existing_skills
+
+    (tmp_path / "skills").mkdir()
+    (tmp_path / "skills" / "active.yaml").write_text(
+        "skills:\n  tech_stack:\n    python: [a]\n  orchestration: [x]\n  notes: keep\n"
+    )
+    (tmp_path / "skills" / "history.yaml").write_text(
+        "skills:\n  tech_stack:\n    python: [b]\n    rust: [c]\n  orchestration: [y]\n"
+    )
+
+    skills = load_existing_skills(tmp_path / "skills.yaml")["skills"]
+
+    assert skills == {
+        "tech_stack": {"python": ["a", "b"], "rust": ["c"]},
+        "orchestration": ["x", "y"],
+        "notes": "keep",
+    }
+    assert list(skills) == ["tech_stack", "orchestration", "notes"]
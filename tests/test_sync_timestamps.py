@@ -0,0 +1,70 @@
+"""
+Test sync_timestamps.py script.
+
+Tests semantic project/skill matching and timestamp drift detection.
+"""
+
+import sys
+from datetime import date
+from pathlib import Path
+
+# Add parent directory to path to import the script
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from sync_timestamps import find_semantic_matches, find_timestamp_drifts
+
+
+def test_find_semantic_matches():
+    assert find_semantic_matches("Voice Pipeline", "pipeline")
+    assert find_semantic_matches("Rust", "Rust CLI tooling")
+    assert find_semantic_matches("ledger-api", "REST API design")
+    assert not find_semantic_matches("Voice Pipeline", "YAML")
+
+
+def test_find_timestamp_drifts_matches_pairwise_semantics():
+    projects = [
+        {"name": "ledger-api", "timestamp": "2025-11-01"},
+        {"name": "Voice Pipeline", "timestamp": date(2025, 11, 20)},
+        {"name": "Broken", "timestamp": "not a date"},
+    ]
+    skills = [
+        {"name": "REST API design", "timestamp": "2025-11-20T09:00:00"},
+        {"name": "pipeline", "timestamp": "2025-11-18"},
+        {"name": "broken things", "timestamp": "2025-01-01"},
+        {"name": "Python", "timestamp": "2025-11-30"},
+    ]
+
+    drifts = find_timestamp_drifts(projects, skills)
+
+    assert [(p["name"], s["name"], days, canonical) for p, s, days, canonical in drifts] == [
+        ("ledger-api", "REST API design", 20, "2025-11-20"),
+    ]
+    assert find_timestamp_drifts([], skills) == []
+
+
+def test_find_timestamp_drifts_substring_edge_cases():
+    """Short and empty names, and projects named inside a skill, pair like find_semantic_matches."""
+    projects = [
+        {"name": "Go", "timestamp": "2025-11-01"},
+        {"name": "", "timestamp": "2025-10-01"},
+        {"name": "Voice Pipeline v2", "timestamp": "2025-09-01"},
+    ]
+    skills = [
+        {"name": "go", "timestamp": "2025-11-20"},
+        {"name": "Django", "timestamp": "2025-11-20"},
+        {"name": "Voice Pipeline v2 tuning", "timestamp": "2025-11-20"},
+        {"name": "x", "timestamp": "2025-11-20"},
+    ]
+
+    drifts = find_timestamp_drifts(projects, skills)
+
+    pairs = [(p["name"], s["name"]) for p, s, _, _ in drifts]
+    assert pairs == [
+        (p["name"], s["name"]) for p in projects for s in skills
+        if find_semantic_matches(p["name"], s["name"])
+    ]
+    assert ("Go", "go") in pairs and ("Go", "Django") in pairs
+    assert ("Go", "x") not in pairs
+    assert [s for p, s in pairs if p == ""] == [s["name"] for s in skills]
+    assert ("Voice Pipeline v2", "Voice Pipeline v2 tuning") in pairs
+    assert ("Voice Pipeline v2", "x") not in pairs
@@ -0,0 +1,43 @@
+"""
+Test update_decision_recency.py script.
+
+Tests stale/active transitions and that no-op runs leave the file untouched.
+"""
+
+import sys
+from pathlib import Path
+
+import yaml
+
+# Add parent directory to path to import the script
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from update_decision_recency import update_decision_recency
+
+
+def test_transitions_are_written_and_noops_are_not(tmp_path):
+    decisions_path = tmp_path / "commit_decisions.yaml"
+    decisions_path.write_text(
+        "decisions:\n"
+        "  - {id: old, status: active, commit_date: '2020-01-01T00:00:00Z'}\n"
+        "  - {id: new, status: active, commit_date: '2999-01-01T00:00:00Z'}\n"
+    )
+
+    stats = update_decision_recency(decisions_path)
+
+    assert (stats["active"], stats["stale"], stats["transitions"]) == (1, 1, 1)
+    written = decisions_path.read_text()
+    assert [d["status"] for d in yaml.safe_load(written)["decisions"]] == ["stale", "active"]
+
+    # Second run changes nothing, so the file is not rewritten
+    decisions_path.write_text(written + "# reviewed\n")
+    assert update_decision_recency(decisions_path)["transitions"] == 0
+    assert decisions_path.read_text().endswith("# reviewed\n")
+
+
+def test_missing_status_is_recorded(tmp_path):
+    decisions_path = tmp_path / "commit_decisions.yaml"
+    decisions_path.write_text("decisions:\n  - {id: new, commit_date: '2999-01-01T00:00:00Z'}\n")
+
+    assert update_decision_recency(decisions_path)["transitions"] == 0
+    assert yaml.safe_load(decisions_path.read_text())["decisions"][0]["status"] == "active"
@@ -0,0 +1,74 @@
+"""
+Test validate_ledger_schema.py script.
+
+Tests pattern field checks and incremental ledger validation.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path to import the script
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import validate_ledger_schema
+
+
+def test_validation_reports_every_file(tmp_path, monkeypatch, capsys):
+    ledger = tmp_path / "ledger"
+    (ledger / "nested").mkdir(parents=True)
+    (ledger / "ok.yaml").write_text(
+        "observed_patterns:\n  good: {pattern: a, instances: [1, 2], last_updated: x}\n"
+    )
+    (ledger / "nested" / "thin.yaml").write_text(
+        "observed_patterns:\n  thin: {pattern: a, instances: [1]}\n  odd: 3\n"
+    )
+    (ledger / "broken.yaml").write_text("bad: [\n")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sys, "argv", ["validate_ledger_schema.py"])
+
+    with pytest.raises(SystemExit) as exit_info:
+        validate_ledger_schema.main()
+    out = capsys.readouterr().out
+
+    assert exit_info.value.code == 1
+    assert "Pattern 'thin' missing 'last_updated'" in out
+    assert "Pattern 'thin' has <2 instances" in out
+    assert "thin.yaml: Parse error" in out
+    assert "broken.yaml: Parse error" in out
+    assert "'good'" not in out
+
+
+def test_incremental_validation_skips_unchanged_passing_files(tmp_path, monkeypatch, capsys):
+    ledger = tmp_path / "ledger"
+    ledger.mkdir()
+    good = ledger / "good.yaml"
+    good.write_text("observed_patterns:\n  p: {pattern: a, instances: [1, 2], last_updated: x}\n")
+    thin = ledger / "thin.yaml"
+    thin.write_text("observed_patterns:\n  p: {pattern: a, instances: [1], last_updated: x}\n")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sys, "argv", ["validate_ledger_schema.py", "--incremental"])
+
+    validated = []
+    validate_file = validate_ledger_schema.validate_file
+    monkeypatch.setattr(validate_ledger_schema, "validate_file",
+                        lambda path: validated.append(path.name) or validate_file(path))
+
+    def run():
+        validated.clear()
+        with pytest.raises(SystemExit) as exit_info:
+            validate_ledger_schema.main()
+        return exit_info.value.code, sorted(validated), capsys.readouterr().out
+
+    assert run()[:2] == (1, ["good.yaml", "thin.yaml"])
+    code, names, out = run()
+    assert (code, names) == (1, ["thin.yaml"])
+    assert "thin.yaml: Pattern 'p' has <2 instances" in out
+
+    thin.write_text("observed_patterns:\n  p: {pattern: a, instances: [1, 2, 3], last_updated: x}\n")
+    assert run()[:2] == (0, ["thin.yaml"])
+    assert run()[:2] == (0, [])
+
+    good.write_text("observed_patterns:\n  p: {pattern: a}\n")
+    assert run()[:2] == (1, ["good.yaml"])